@@ -18,15 +18,22 @@ __version__ = "2.0"
 import os
 import re
 import time
-import queue
 import threading
 from dataclasses import dataclass
 from datetime import datetime
+from types import SimpleNamespace
+import collections
+import concurrent.futures
 import difflib
+import functools
+import itertools
 import json
+import logging
+import operator
 import sqlite3
 import subprocess
 import shutil
+import sys
 from uuid import uuid4
 from pathlib import Path
 
@@ -46,9 +53,11 @@ import tkinter.font as tkfont
 try:
     from tkinterdnd2 import DND_FILES, TkinterDnD  # type: ignore
     _BaseTk = TkinterDnD.Tk
+    _HAS_DND = True
 except Exception:  # pragma: no cover
     DND_FILES = None  # type: ignore
     _BaseTk = tk.Tk
+    _HAS_DND = False
 
 
 # ------------------------- Theme -------------------------
@@ -120,6 +129,9 @@ TEXTS = {
         'options': '选项',
         'include_subfolders': '包含子文件夹',
         'dry_run': '仅预览（不真正重命名）',
+        'parallel_rename': '多个文件夹并行重命名（U 盘/网络盘建议关闭）',
+        'verbose_log': '日志逐个文件记录（默认按文件夹汇总）',
+        'skip_hardlinks': '硬链接只改第一个名字（同一文件的其他链接跳过）',
         'date_source': '日期来源',
         'date_source_mtime': '修改时间（mtime）',
         'date_source_ctime': '创建时间（ctime）',
@@ -170,6 +182,7 @@ TEXTS = {
         'summary_prefix': '日期前缀',
         'summary_auto_index': '自动序号 {suffix}',
         'summary_skip_prefix': '跳过：已有日期前缀',
+        'summary_skip_hardlink': '跳过：与本次已处理的文件是同一文件（硬链接）',
         'log_title': '处理日志',
         'status_ready': '就绪',
         'status_idle': '就绪',
@@ -179,6 +192,9 @@ TEXTS = {
         'processing_folder': '找到 {} 个文件，开始处理…',
         'no_files': '文件夹中没有文件。',
         'skip': '跳过：{}（已有日期前缀）',
+        'skip_hardlink': '跳过：{}（硬链接，同一文件已处理）',
+        'dir_summary': '{dir}：重命名 {renamed}，跳过 {skipped}，冲突 {conflicts}',
+        'dir_summary_preview': '{dir}：将重命名 {renamed}，跳过 {skipped}，冲突 {conflicts}',
         'warning_exists': '已存在：{}，跳过：{}',
         'preview_rename': '预览：{} → {}',
         'success_rename': '✓ {} → {}',
@@ -231,6 +247,9 @@ TEXTS = {
         'options': 'Options',
         'include_subfolders': 'Include subfolders',
         'dry_run': 'Dry-run (no rename)',
+        'parallel_rename': 'Rename folders in parallel (turn off for USB/network drives)',
+        'verbose_log': 'Log every file (default: one summary per folder)',
+        'skip_hardlinks': 'Rename only the first name of a hard-linked file (skip its other links)',
         'date_source': 'Date source',
         'date_source_mtime': 'Modified time (mtime)',
         'date_source_ctime': 'Created time (ctime)',
@@ -280,6 +299,7 @@ TEXTS = {
         'summary_prefix': 'Date prefix',
         'summary_auto_index': 'Auto index {suffix}',
         'summary_skip_prefix': 'Skip: already has date prefix',
+        'summary_skip_hardlink': 'Skip: hard link to a file already in this run',
         'log_title': 'Processing Log',
         'status_ready': 'Ready',
         'status_idle': 'Ready',
@@ -289,6 +309,9 @@ TEXTS = {
         'processing_folder': 'Found {} files, starting…',
         'no_files': 'No files in folder.',
         'skip': 'Skip: {} (already has date prefix)',
+        'skip_hardlink': 'Skip: {} (hard link, same file already handled)',
+        'dir_summary': '{dir}: renamed {renamed}, skipped {skipped}, conflicts {conflicts}',
+        'dir_summary_preview': '{dir}: would rename {renamed}, skipped {skipped}, conflicts {conflicts}',
         'warning_exists': 'Exists: {}, skipping: {}',
         'preview_rename': 'Preview: {} → {}',
         'success_rename': '✓ {} → {}',
@@ -315,6 +338,24 @@ TEXTS = {
 }
 
 
+# Keys that may be missing from a language table, resolved once per language switch.
+_TEXT_FALLBACKS = {
+    'pick_folder': 'Choose Folder',
+    'pick_file': 'Choose File',
+    'filters_clear': 'Clear',
+    'status_ready': 'Ready',
+    'status_idle': 'Ready',
+    'warning': 'Warning',
+}
+
+
+def _texts_for(language: str) -> SimpleNamespace:
+    """Flatten TEXTS[language] (fallbacks applied) into an attribute namespace for the UI thread."""
+    t = TEXTS.get(language, TEXTS['zh'])
+    merged = {**_TEXT_FALLBACKS, 'summary_meta_fallback': t['summary_exif_fallback'], **t}
+    return SimpleNamespace(**merged)
+
+
 
 # ========================= UI Skin Layer =========================
 # 只想改“外观（颜色/字体/间距/圆角/阴影）”的时候，尽量只改这里：
@@ -355,6 +396,44 @@ class UIMetrics:
 UI_METRICS = UIMetrics()
 
 
+class Fonts:
+    """界面用到的命名字体（Tk named font 名称常量）。
+
+    SkinLayer.init_fonts() 启动时一次性创建 SPECS 中的全部字体；控件直接传
+    Fonts.BODY11B 这类字符串，切换语言时由 refresh_fonts() 统一改 family。
+    """
+
+    BODY10 = 'AR.Body10'
+    BODY10B = 'AR.Body10B'
+    BODY11 = 'AR.Body11'
+    BODY11B = 'AR.Body11B'
+    BODY12 = 'AR.Body12'
+    BODY13 = 'AR.Body13'
+    BODY13B = 'AR.Body13B'
+    BODY14B = 'AR.Body14B'
+    BODY22B = 'AR.Body22B'
+    BODY26B = 'AR.Body26B'
+    BODY56B = 'AR.Body56B'
+
+    # (name, size, weight)
+    SPECS: tuple[tuple[str, int, str], ...] = (
+        (BODY10, 10, 'normal'),
+        (BODY10B, 10, 'bold'),
+        (BODY11, 11, 'normal'),
+        (BODY11B, 11, 'bold'),
+        (BODY12, 12, 'normal'),
+        (BODY13, 13, 'normal'),
+        (BODY13B, 13, 'bold'),
+        (BODY14B, 14, 'bold'),
+        (BODY22B, 22, 'bold'),
+        (BODY26B, 26, 'bold'),
+        (BODY56B, 56, 'bold'),
+    )
+
+
+_log = logging.getLogger(__name__)
+
+
 class SkinLayer:
     """集中管理 UI 皮肤层：字体、窗口尺寸、ttk 样式、圆形勾选框等。"""
 
@@ -364,9 +443,12 @@ class SkinLayer:
         self.metrics = metrics
         self.font_zh = 'Arial'
         self.font_en = 'Arial'
+        self._root: tk.Tk | None = None
+        self._named_fonts: dict[str, tkfont.Font] = {}
 
     # ---- fonts ----
     def init_fonts(self, root: tk.Tk) -> None:
+        self._root = root
         try:
             families = set(tkfont.families(root))
         except Exception:
@@ -384,9 +466,30 @@ class SkinLayer:
         )
         self.font_en = pick(['Segoe UI', 'Arial', 'Helvetica'], 'Arial')
 
+        family = self.font_zh if self.language == 'zh' else self.font_en
+        for name, size, weight in Fonts.SPECS:
+            if name not in self._named_fonts:
+                self._named_fonts[name] = tkfont.Font(root=root, name=name, family=family, size=size, weight=weight)
+
     def font(self, size: int, weight: str = 'normal'):
+        """返回共享的 Tk 命名字体名（如 AR.Body11 / AR.Body13B）。
+
+        同一 (size, weight) 的所有控件共用一个字体对象；切换语言时只需
+        refresh_fonts() 改一次 family，所有控件与 ttk 样式自动跟随。
+        """
         family = self.font_zh if self.language == 'zh' else self.font_en
-        return (family, size, weight)
+        if self._root is None:
+            return (family, size, weight)
+        name = f"AR.Body{size}{'B' if weight == 'bold' else ''}"
+        if name not in self._named_fonts:
+            self._named_fonts[name] = tkfont.Font(root=self._root, name=name, family=family, size=size, weight=weight)
+        return name
+
+    def refresh_fonts(self) -> None:
+        """Re-point every named font to the current language's family."""
+        family = self.font_zh if self.language == 'zh' else self.font_en
+        for f in self._named_fonts.values():
+            f.configure(family=family)
 
     # ---- window ----
     def apply_window(self, root: tk.Tk, title: str) -> None:
@@ -397,73 +500,91 @@ class SkinLayer:
 
     # ---- ttk style ----
     def apply_ttk_style(self, root: tk.Tk) -> None:
-        """ttk 样式：尽量做成干净、扁平、低对比的 Apple 风格。"""
+        """ttk 样式：尽量做成干净、扁平、低对比的 Apple 风格。
+
+        每个控件样式单独下发：某一项被当前 Tk/主题拒绝时只跳过这一项并记日志，
+        其余样式照常生效。
+        """
         try:
             style = ttk.Style(root)
             if 'clam' in style.theme_names():
                 style.theme_use('clam')
+        except Exception:
+            _log.warning('ttk theme setup failed', exc_info=True)
+            return
 
+        try:
             self.ensure_round_checkbuttons(root, style)
+        except Exception:
+            _log.warning('round checkbutton indicators not created', exc_info=True)
 
-            style.configure('TCheckbutton', background=self.colors['bg_main'], font=self.font(self.metrics.body_size))
-            style.configure('Card.TCheckbutton', background=self.colors['bg_card'], font=self.font(self.metrics.body_size))
-
-            style.configure('TProgressbar', thickness=self.metrics.progress_thickness)
-
+        c = self.colors
+        m = self.metrics
+        body_font = self.font(m.body_size)
+        # 所有 configure/map/layout（含圆形勾选框）按控件样式名汇总成一个 dict
+        settings = self.round_checkbutton_settings()
+        settings['TCheckbutton']['configure'].update(background=c['bg_main'], font=body_font)
+        settings['Card.TCheckbutton']['configure'].update(background=c['bg_card'], font=body_font)
+        settings.update({
+            'TProgressbar': {'configure': {'thickness': m.progress_thickness}},
             # Scrollbar：单色胶囊感（去掉箭头，缩窄宽度）
-            style.layout(
-                'Pill.Vertical.TScrollbar',
-                [('Vertical.Scrollbar.trough', {
+            'Pill.Vertical.TScrollbar': {
+                'layout': [('Vertical.Scrollbar.trough', {
                     'sticky': 'ns',
                     'children': [('Vertical.Scrollbar.thumb', {'expand': '1', 'sticky': 'nswe'})]
-                })]
-            )
-            style.configure(
-                'Pill.Vertical.TScrollbar',
-                troughcolor=self.colors['bg_main'],
-                background=self.colors['scroll_thumb'],
-                bordercolor=self.colors['bg_main'],
-                lightcolor=self.colors['bg_main'],
-                darkcolor=self.colors['bg_main'],
-                arrowcolor=self.colors['bg_main'],
-                gripcount=0,
-                width=self.metrics.scrollbar_width,
-            )
-            style.map(
-                'Pill.Vertical.TScrollbar',
-                background=[('active', self.colors['scroll_thumb_hover'])]
-            )
-
-            style.configure(
-                'Treeview',
-                background=self.colors['bg_card'],
-                fieldbackground=self.colors['bg_card'],
-                foreground=self.colors['text_primary'],
-                borderwidth=0,
-                relief='flat',
-                font=self.font(self.metrics.small_size),
-                rowheight=self.metrics.tree_rowheight,
-            )
-            style.map(
-                'Treeview',
-                background=[('selected', '#DCEBFF')],
-                foreground=[('selected', self.colors['text_primary'])],
-            )
-
-            style.configure(
-                'Treeview.Heading',
-                background=self.colors['bg_main'],
-                foreground=self.colors['text_secondary'],
-                relief='flat',
-                font=self.font(self.metrics.body_size, 'bold'),
-                padding=(10, 8),
-            )
-            style.map('Treeview.Heading', background=[('active', self.colors['bg_main'])])
-        except Exception:
-            pass
+                })],
+                'configure': {
+                    'troughcolor': c['bg_main'],
+                    'background': c['scroll_thumb'],
+                    'bordercolor': c['bg_main'],
+                    'lightcolor': c['bg_main'],
+                    'darkcolor': c['bg_main'],
+                    'arrowcolor': c['bg_main'],
+                    'gripcount': 0,
+                    'width': m.scrollbar_width,
+                },
+                'map': {'background': [('active', c['scroll_thumb_hover'])]},
+            },
+            'Treeview': {
+                'configure': {
+                    'background': c['bg_card'],
+                    'fieldbackground': c['bg_card'],
+                    'foreground': c['text_primary'],
+                    'borderwidth': 0,
+                    'relief': 'flat',
+                    'font': self.font(m.small_size),
+                    'rowheight': m.tree_rowheight,
+                },
+                'map': {
+                    'background': [('selected', '#DCEBFF')],
+                    'foreground': [('selected', c['text_primary'])],
+                },
+            },
+            'Treeview.Heading': {
+                'configure': {
+                    'background': c['bg_main'],
+                    'foreground': c['text_secondary'],
+                    'relief': 'flat',
+                    'font': self.font(m.body_size, 'bold'),
+                    'padding': (10, 8),
+                },
+                'map': {'background': [('active', c['bg_main'])]},
+            },
+        })
+
+        theme = style.theme_use()
+        for name, spec in settings.items():
+            try:
+                style.theme_settings(theme, {name: spec})
+            except Exception:
+                _log.warning('ttk style %r not applied', name, exc_info=True)
 
     def ensure_round_checkbuttons(self, root: tk.Tk, style: ttk.Style) -> None:
-        """把默认方形勾选框替换成“圆形 + 主题色圆点”的指示器（仍然是 Checkbutton 行为）。"""
+        """把默认方形勾选框替换成“圆形 + 主题色圆点”的指示器（仍然是 Checkbutton 行为）。
+
+        这里只生成指示器图片并注册 element；使用这些 element 的 layout 与前景色
+        由 round_checkbutton_settings() 提供，随 apply_ttk_style 一起下发。
+        """
         if getattr(root, '_round_cb_ready', False):
             return
 
@@ -533,51 +654,40 @@ class SkinLayer:
         except tk.TclError:
             pass
 
-        layout_card = [
-            ('Checkbutton.padding', {
-                'sticky': 'nswe',
-                'children': [
-                    ('RoundCard.indicator', {'side': 'left', 'sticky': '', 'padx': (0, 6)}),
-                    ('Checkbutton.focus', {
-                        'side': 'left',
-                        'sticky': 'w',
-                        'children': [('Checkbutton.label', {'sticky': 'nswe'})]
-                    }),
-                ]
-            }),
-        ]
-        layout_main = [
-            ('Checkbutton.padding', {
-                'sticky': 'nswe',
-                'children': [
-                    ('RoundMain.indicator', {'side': 'left', 'sticky': '', 'padx': (0, 6)}),
-                    ('Checkbutton.focus', {
-                        'side': 'left',
-                        'sticky': 'w',
-                        'children': [('Checkbutton.label', {'sticky': 'nswe'})]
-                    }),
-                ]
-            }),
-        ]
-
-        try:
-            style.layout('Card.TCheckbutton', layout_card)
-        except tk.TclError:
-            pass
-        try:
-            style.layout('TCheckbutton', layout_main)
-        except tk.TclError:
-            pass
+        root._round_cb_ready = True
 
-        try:
-            style.configure('Card.TCheckbutton', foreground=c['text_primary'])
-            style.map('Card.TCheckbutton', foreground=[('disabled', c['text_secondary'])])
-            style.configure('TCheckbutton', foreground=c['text_primary'])
-            style.map('TCheckbutton', foreground=[('disabled', c['text_secondary'])])
-        except Exception:
-            pass
+    def round_checkbutton_settings(self) -> dict:
+        """theme_settings fragment: round-indicator layouts and foreground colors for checkbuttons."""
+        c = self.colors
 
-        root._round_cb_ready = True
+        def layout(indicator: str) -> list:
+            return [
+                ('Checkbutton.padding', {
+                    'sticky': 'nswe',
+                    'children': [
+                        (indicator, {'side': 'left', 'sticky': '', 'padx': (0, 6)}),
+                        ('Checkbutton.focus', {
+                            'side': 'left',
+                            'sticky': 'w',
+                            'children': [('Checkbutton.label', {'sticky': 'nswe'})]
+                        }),
+                    ]
+                }),
+            ]
+
+        fg_map = {'foreground': [('disabled', c['text_secondary'])]}
+        return {
+            'Card.TCheckbutton': {
+                'layout': layout('RoundCard.indicator'),
+                'configure': {'foreground': c['text_primary']},
+                'map': fg_map,
+            },
+            'TCheckbutton': {
+                'layout': layout('RoundMain.indicator'),
+                'configure': {'foreground': c['text_primary']},
+                'map': fg_map,
+            },
+        }
 
 # ------------------------- Helpers -------------------------
 DATE_PREFIX_RE = re.compile(r'^\d{8}_')
@@ -587,6 +697,9 @@ DATE_PREFIX_RE = re.compile(r'^\d{8}_')
 class RenameOptions:
     include_subfolders: bool = False
     dry_run: bool = False
+    parallel_rename: bool = True  # 不同父目录的重命名分给线程池并行执行
+    verbose_log: bool = False  # False：跳过/成功/冲突按目录汇总成一行日志
+    skip_hardlinks: bool = False  # True：同一 (st_dev, st_ino) 的多个链接只改第一个名字
     date_source: str = 'mtime'  # mtime / ctime / exif
     filter_exts: str = ''
     filter_include: str = ''
@@ -624,7 +737,7 @@ class PlanItem:
     original_name: str
     base_name: str | None = None
     final_name: str | None = None
-    status: str = 'rename'  # rename / skip_prefix / skip_filter / error
+    status: str = 'rename'  # rename / skip_prefix / skip_hardlink / skip_filter / error
     note_code: str | None = None
     conflict_index: int = 0
     summary: str = ''
@@ -644,6 +757,19 @@ class RenamePlan:
     scan_errors: list[str]
     cancelled: bool = False
 
+
+@dataclass(slots=True)
+class PreviewRow:
+    """One row of the preview table (built off the UI thread, one per PlanItem)."""
+    original: str
+    final: str
+    summary: str
+    changed: bool
+    conflict: bool
+    folder: str
+    suffix: str = ''
+    opcodes: list | tuple = ()  # SequenceMatcher opcodes old -> new; empty when unchanged
+
 def _has_any_date_prefix(filename: str) -> bool:
     """判断文件名是否已带任意日期前缀（YYYYMMDD_）"""
     return bool(DATE_PREFIX_RE.match(filename))
@@ -673,23 +799,68 @@ def _bind_hover(btn: tk.Widget, normal_bg: str, hover_bg: str) -> None:
     btn.bind('<Leave>', _on_leave)
 
 
-def _parse_exts(raw: str) -> set[str]:
-    """Parse extension filter like 'jpg,png,.pdf' into a set of lower-case suffixes (with leading dots)."""
+@functools.lru_cache(maxsize=64)
+def _parse_exts(raw: str) -> frozenset[str]:
+    """Parse extension filter like 'jpg,png,.pdf' into a set of case-folded suffixes (with leading dots).
+
+    Returns an immutable frozenset so the result can be memoized per filter string.
+    """
     raw = (raw or '').strip()
     if not raw:
-        return set()
+        return frozenset()
     parts = re.split(r"[\s,;]+", raw)
     exts: set[str] = set()
     for p in parts:
-        p = p.strip().lower()
+        p = p.strip().casefold()
         if not p:
             continue
         if p == '*':
-            return set()
+            return frozenset()
         if not p.startswith('.'):
             p = '.' + p
         exts.add(p)
-    return exts
+    return frozenset(exts)
+
+
+def _normalize_filter(filter_exts: str, filter_include: str, filter_exclude: str) -> tuple[frozenset[str], str, str]:
+    """Trim and case-fold the raw filter fields once: (extension set, include text, exclude text)."""
+    return (
+        _parse_exts(filter_exts),
+        (filter_include or '').strip().casefold(),
+        (filter_exclude or '').strip().casefold(),
+    )
+
+
+def _make_name_filter(exts: frozenset[str], inc: str, exc: str):
+    """Compile the extension/include/exclude filters into one predicate over (name, ...) tuples.
+
+    Expects the values from _normalize_filter; names are case-folded the same
+    way before comparing. Returns None when no filter is active. Filter values
+    are bound as default arguments so the closure reads them as locals.
+    """
+    if not (exts or inc or exc):
+        return None
+    if exts and not inc and not exc:
+        # 只有后缀过滤：后缀规则同 PurePath.suffix，只对切出来的后缀做 casefold()
+        def _pred(f, _exts=exts):
+            name = f[0]
+            dot = name.rfind('.')
+            return 0 < dot < len(name) - 1 and name[dot:].casefold() in _exts
+        return _pred
+
+    def _pred(f, _exts=exts, _inc=inc, _exc=exc):
+        # 只做一次 casefold()，三个条件共用
+        name_cf = f[0].casefold()
+        if _exts:
+            dot = name_cf.rfind('.')
+            if not (0 < dot < len(name_cf) - 1 and name_cf[dot:] in _exts):
+                return False
+        if _inc and _inc not in name_cf:
+            return False
+        if _exc and _exc in name_cf:
+            return False
+        return True
+    return _pred
 
 
 def _is_windows() -> bool:
@@ -723,45 +894,141 @@ def _win_extended_path(path_str: str) -> str:
     return '\\\\?\\' + p
 
 
-def _safe_rename(src: Path, dst: Path) -> None:
-    """Robust rename with Windows long-path support."""
+def _safe_rename(src: str | Path, dst: str | Path) -> None:
+    """Robust rename with Windows long-path support. Accepts str or Path."""
     if _is_windows():
         os.rename(_win_extended_path(str(src)), _win_extended_path(str(dst)))
     else:
-        src.rename(dst)
+        os.rename(src, dst)
 
 
-def _iter_files_tolerant(folder: Path, include_subfolders: bool) -> tuple[list[Path], list[str]]:
-    """Tolerant file scan.
-
-    Returns (files, scan_errors). The scan never aborts the whole run because of
-    one unreadable directory or a permission error.
+def _scandir_files(
+    root: str,
+    recursive: bool,
+    errors: list[str],
+    dir_names: dict[str, list[str]] | None = None,
+    subdirs: list[str] | None = None,
+    cancel_event: threading.Event | None = None,
+):
+    """Yield os.DirEntry for every regular file under root using os.scandir only.
+
+    DirEntry.is_dir()/is_symlink() are answered from the d_type that scandir
+    already returned, so no extra stat() per entry. Subdirectory symlinks are
+    listed but not followed (same as os.walk(followlinks=False)); errors are
+    collected into `errors` instead of aborting the walk.
+
+    When dir_names is given, every entry name of each visited directory
+    (files and subfolders alike, i.e. what os.listdir would return) is
+    recorded under the directory path, so callers need not list it again.
+    When not recursive and subdirs is given, real (non-symlink) subfolders
+    are appended to it instead of being walked. cancel_event is checked once
+    per directory; when set, the walk stops early.
     """
-    files: list[Path] = []
-    errors: list[str] = []
-
-    if include_subfolders:
-        def _onerror(e: OSError):
-            errors.append(str(e))
-
-        for root, _dirs, filenames in os.walk(str(folder), topdown=True, onerror=_onerror):
-            for fn in filenames:
-                files.append(Path(root) / fn)
-    else:
+    stack = [root]
+    while stack:
+        if cancel_event is not None and cancel_event.is_set():
+            return
+        d = stack.pop()
+        names: list[str] | None = None
+        if dir_names is not None:
+            names = dir_names[sys.intern(d)] = []
         try:
-            with os.scandir(folder) as it:
+            with os.scandir(d) as it:
                 for entry in it:
+                    if names is not None:
+                        names.append(entry.name)
                     try:
-                        if entry.is_file():
-                            files.append(Path(entry.path))
-                    except Exception as e:
-                        errors.append(f"{entry.path}: {e}")
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        if not entry.is_symlink():
+                            if recursive:
+                                stack.append(entry.path)
+                            elif subdirs is not None:
+                                subdirs.append(entry.path)
+                        continue
+                    # 只要普通文件（跟随符号链接）：断链、FIFO、socket、设备文件一律不碰
+                    try:
+                        is_file = entry.is_file()
+                    except OSError:
+                        is_file = False
+                    if is_file:
+                        yield entry
         except Exception as e:
-            errors.append(f"{folder}: {e}")
+            errors.append(f"{d}: {e}")
+
+
+_SCAN_PARALLEL_WORKERS = 4
+# 子目录并行扫描共用一个常驻线程池（首次用到时创建），不再每次扫描新建/销毁线程
+_SCAN_POOL: concurrent.futures.ThreadPoolExecutor | None = None
+_SCAN_POOL_LOCK = threading.Lock()
+# 执行阶段按父目录分组并行：os.rename 期间会释放 GIL，不同目录互不影响
+_RENAME_PARALLEL_WORKERS = 8
+
+
+def _scan_subtree(
+    root: str,
+    cancel_event: threading.Event | None = None,
+) -> tuple[list[os.DirEntry], list[str], dict[str, list[str]]]:
+    """Recursively scan one subfolder; returns (file entries, errors, dir_names). Used by the parallel scan."""
+    errors: list[str] = []
+    dir_names: dict[str, list[str]] = {}
+    found = list(_scandir_files(root, True, errors, dir_names, cancel_event=cancel_event))
+    return found, errors, dir_names
+
+
+def _get_scan_pool() -> concurrent.futures.ThreadPoolExecutor:
+    """Return the shared executor used for parallel subtree scans."""
+    global _SCAN_POOL
+    with _SCAN_POOL_LOCK:
+        if _SCAN_POOL is None:
+            _SCAN_POOL = concurrent.futures.ThreadPoolExecutor(
+                max_workers=_SCAN_PARALLEL_WORKERS, thread_name_prefix='ar-scan',
+            )
+        return _SCAN_POOL
+
+
+def _scan_entries(
+    folder: Path,
+    include_subfolders: bool,
+    dir_names: dict[str, list[str]] | None = None,
+    cancel_event: threading.Event | None = None,
+) -> tuple[list[os.DirEntry], list[str]]:
+    """Tolerant file scan returning os.DirEntry objects.
+
+    Returns (entries, scan_errors), sorted by path. The scan never aborts the
+    whole run because of one unreadable directory or a permission error. See
+    _scandir_files for dir_names and cancel_event (a cancelled scan returns a
+    partial list; callers check the event). Callers read entry.name /
+    entry.path and the cached entry.stat() directly and only build a Path for
+    files they keep.
+    """
+    errors: list[str] = []
+    root = str(folder)
+    if not include_subfolders or (os.cpu_count() or 1) < 2:
+        found = list(_scandir_files(root, include_subfolders, errors, dir_names, cancel_event=cancel_event))
+    else:
+        # 递归扫描受 IO 延迟限制：先列根目录，再把各个顶层子目录分给线程池并行走
+        subdirs: list[str] = []
+        found = list(_scandir_files(root, False, errors, dir_names, subdirs, cancel_event))
+        if len(subdirs) > 1:
+            # 子任务按目录检查 cancel_event：关窗口/新刷新时池里的线程很快就空出来
+            results = list(_get_scan_pool().map(_scan_subtree, subdirs, itertools.repeat(cancel_event)))
+        else:
+            results = [_scan_subtree(d, cancel_event) for d in subdirs]
+        for sub_found, sub_errors, sub_names in results:
+            found += sub_found
+            errors += sub_errors
+            if dir_names is not None:
+                dir_names.update(sub_names)
 
     # Stable ordering for deterministic auto-indexing.
-    files.sort(key=lambda p: str(p).casefold() if _is_windows() else str(p))
-    return files, errors
+    if _is_windows():
+        found.sort(key=lambda e: e.path.casefold())
+    else:
+        found.sort(key=lambda e: e.path)
+    return found, errors
 
 
 def _resolve_conflict_auto_index(
@@ -771,18 +1038,26 @@ def _resolve_conflict_auto_index(
     *,
     key_func=_name_key,
     max_tries: int = 999,
+    start: int = 1,
 ) -> tuple[str, int]:
     """Resolve name conflicts by appending _001/_002... before extension.
 
+    start lets the caller skip indices it already knows are taken (the plan
+    keeps a per-directory "next index" for each base name, so N files that
+    collide on one name cost O(N) probes instead of O(N^2)).
+
     Returns: (resolved_name, index). index==0 means no conflict (base_name used).
     """
-    if key_func(base_name) not in existing_keys and key_func(base_name) not in reserved_keys:
+    k = key_func(base_name)
+    if k not in existing_keys and k not in reserved_keys:
         return base_name, 0
 
+    # 每个候选名只算一次 key（Windows 下是 casefold）
     stem, suffix = os.path.splitext(base_name)
-    for i in range(1, max_tries + 1):
+    for i in range(start, max_tries + 1):
         cand = f"{stem}_{i:03d}{suffix}"
-        if key_func(cand) not in existing_keys and key_func(cand) not in reserved_keys:
+        k = key_func(cand)
+        if k not in existing_keys and k not in reserved_keys:
             return cand, i
 
     raise RuntimeError(f"Too many conflicts when resolving: {base_name}")
@@ -971,43 +1246,84 @@ def _read_video_datetime(p: Path) -> tuple[datetime | None, str | None]:
     return None, note
 
 
-def _get_date_prefix(p: Path, date_source: str) -> tuple[str | None, str | None]:
+@functools.lru_cache(maxsize=4096)
+def _ymd_from_second(sec: int) -> str:
+    tm = time.localtime(sec)
+    return f"{tm.tm_year:04d}{tm.tm_mon:02d}{tm.tm_mday:02d}"
+
+
+# 按 15 分钟窗口缓存本地日期。窗口两端 UTC 偏移相同且日期相同时，窗口内日期不变；
+# 否则（如 St_Johns 在 00:01 切换夏令时）该窗口退回按秒计算
+_YMD_BUCKET_SECONDS = 900
+
+
+@functools.lru_cache(maxsize=4096)
+def _ymd_from_bucket(start: int) -> str | None:
+    a = time.localtime(start)
+    b = time.localtime(start + _YMD_BUCKET_SECONDS - 1)
+    if a.tm_gmtoff != b.tm_gmtoff or (a.tm_year, a.tm_yday) != (b.tm_year, b.tm_yday):
+        return None
+    return f"{a.tm_year:04d}{a.tm_mon:02d}{a.tm_mday:02d}"
+
+
+def _ymd_from_timestamp(ts: float) -> str:
+    """Local-date YYYYMMDD for a POSIX timestamp.
+
+    Same result as datetime.fromtimestamp(ts).strftime('%Y%m%d') without the
+    datetime object or the format parse. Memoized per 15-minute window, so
+    files touched around the same time share one localtime() call; windows
+    that straddle midnight or a UTC-offset change fall back to the exact second.
+    """
+    sec = int(ts // 1)
+    ymd = _ymd_from_bucket(sec - sec % _YMD_BUCKET_SECONDS)
+    return ymd if ymd is not None else _ymd_from_second(sec)
+
+
+def _ymd_from_datetime(dt: datetime) -> str:
+    return f"{dt.year:04d}{dt.month:02d}{dt.day:02d}"
+
+
+def _get_date_prefix(p: Path, date_source: str, entry: os.DirEntry | None = None) -> tuple[str | None, str | None]:
     """Return (YYYYMMDD, note_code) based on selected date source.
 
+    entry, when given, is the os.DirEntry from the scan; its stat() result is
+    cached (and free on Windows), so no second stat syscall is made.
+
     note_code is only meaningful for EXIF mode:
     - None: EXIF datetime found and used
     - 'exif_missing': no usable EXIF datetime, fallback to mtime
     - 'exif_unavailable': cannot read EXIF, fallback to mtime
     """
+    st_src = entry if entry is not None else p
     try:
         if date_source == 'ctime':
-            ts = os.path.getctime(p)
-            return datetime.fromtimestamp(ts).strftime('%Y%m%d'), None
+            ts = st_src.stat().st_ctime
+            return _ymd_from_timestamp(ts), None
 
         if date_source == 'exif':
             # Photo EXIF
             dt, note_code = _read_exif_datetime(p)
             if dt is not None:
-                return dt.strftime('%Y%m%d'), None
+                return _ymd_from_datetime(dt), None
 
             # Video metadata (mp4/mov/...)
             v_note: str | None = None
             if p.suffix.lower() in _VIDEO_META_SUFFIXES:
                 vdt, v_note = _read_video_datetime(p)
                 if vdt is not None:
-                    return vdt.strftime('%Y%m%d'), None
+                    return _ymd_from_datetime(vdt), None
 
             # fallback to mtime
             fallback_note = v_note or note_code or 'meta_missing'
             try:
-                ts = p.stat().st_mtime
-                return datetime.fromtimestamp(ts).strftime('%Y%m%d'), fallback_note
+                ts = st_src.stat().st_mtime
+                return _ymd_from_timestamp(ts), fallback_note
             except Exception:
                 return None, fallback_note
 
         # default: mtime
-        ts = p.stat().st_mtime
-        return datetime.fromtimestamp(ts).strftime('%Y%m%d'), None
+        ts = st_src.stat().st_mtime
+        return _ymd_from_timestamp(ts), None
     except Exception:
         return None, None
 
@@ -1030,65 +1346,94 @@ def _build_rename_plan(
     t = TEXTS.get(language, TEXTS['zh'])
 
     scan_errors: list[str] = []
+    # 扫描时顺带记录每个目录的全部名字，冲突模拟直接复用，不再 os.listdir 第二遍
+    dir_names: dict[str, list[str]] = {}
 
-    # 1) Scan
+    # 非递归扫描时所有文件都在同一个目录：父目录键只算一次，循环里不再逐个 dirname
+    flat_parent: str | None = None
+
+    # 1) Scan —— 过滤阶段只用 (name, path, DirEntry)，留下来的文件才构造 Path
+    files: list[tuple[str, str, os.DirEntry | None]]
     if is_single_file:
-        files = [Path(target_path)]
+        single = Path(target_path)
+        files = [(single.name, str(single), None)]
     else:
         folder = Path(target_path)
-        files, scan_errors = _iter_files_tolerant(folder, opts.include_subfolders)
+        found, scan_errors = _scan_entries(folder, opts.include_subfolders, dir_names, cancel_event)
+        if cancel_event and cancel_event.is_set():
+            return RenamePlan(items=[], scanned=len(found), matched=0, filtered_out=len(found), scan_errors=scan_errors, cancelled=True)
+        files = [(e.name, e.path, e) for e in found]
+        if not opts.include_subfolders:
+            flat_parent = sys.intern(str(folder))
 
     scanned = len(files)
 
     # 2) Filter
-    exts = _parse_exts(opts.filter_exts)
-    inc = (opts.filter_include or '').strip().lower()
-    exc = (opts.filter_exclude or '').strip().lower()
-
-    kept: list[Path] = []
-    filtered_out = 0
-    if exts or inc or exc:
-        for p in files:
-            if cancel_event and cancel_event.is_set():
-                return RenamePlan(items=[], scanned=scanned, matched=0, filtered_out=scanned, scan_errors=scan_errors, cancelled=True)
-            name_lower = p.name.lower()
-            if exts and p.suffix.lower() not in exts:
-                filtered_out += 1
-                continue
-            if inc and inc not in name_lower:
-                filtered_out += 1
-                continue
-            if exc and exc in name_lower:
-                filtered_out += 1
-                continue
-            kept.append(p)
-    else:
-        kept = files
+    exts, inc, exc = _normalize_filter(opts.filter_exts, opts.filter_include, opts.filter_exclude)
+
+    # 过滤条件编译成一个谓词交给内建 filter()，不再逐个 append / 计数
+    pred = _make_name_filter(exts, inc, exc)
+    kept: list[tuple[str, str, os.DirEntry | None]] = files if pred is None else list(filter(pred, files))
+    if cancel_event and cancel_event.is_set():
+        return RenamePlan(items=[], scanned=scanned, matched=0, filtered_out=scanned, scan_errors=scan_errors, cancelled=True)
 
     matched = len(kept)
+    filtered_out = scanned - matched
 
     # 3) Build mapping with per-directory collision simulation
-    existing_keys_by_dir: dict[Path, set[str]] = {}
-    reserved_keys_by_dir: dict[Path, set[str]] = {}
+    # 以 intern 过的目录字符串为键：同目录文件共享同一对象，避免 PurePath.__hash__ 的开销
+    existing_keys_by_dir: dict[str, set[str]] = {}
+    reserved_keys_by_dir: dict[str, set[str]] = {}
+    next_index: dict[tuple[str, str], int] = {}
     items: list[PlanItem] = []
-
-    for p in kept:
+    # 硬链接去重（需显式开启）：同一个 (st_dev, st_ino) 只改第一个名字
+    skip_hardlinks = opts.skip_hardlinks
+    seen_inodes: set[tuple[int, int]] = set()
+
+    # 热循环里把全局函数绑定为局部变量（LOAD_FAST 代替 LOAD_GLOBAL）
+    # 直接用已编译正则的 match（C 实现），省掉 _has_any_date_prefix 这一层 Python 调用和 bool()
+    _has_prefix = DATE_PREFIX_RE.match
+    _date_prefix = _get_date_prefix
+    _key = _name_key
+    _resolve = _resolve_conflict_auto_index
+    _listdir = os.listdir
+    _dirname = os.path.dirname
+    _intern = sys.intern
+
+    for original, path_str, entry in kept:
         if cancel_event and cancel_event.is_set():
             return RenamePlan(items=items, scanned=scanned, matched=matched, filtered_out=filtered_out, scan_errors=scan_errors, cancelled=True)
 
-        original = p.name
-        parent = p.parent
+        p = Path(path_str)
+        parent = flat_parent or _intern(_dirname(path_str) or '.')
         item = PlanItem(path=p, original_name=original)
 
-        # Already has date prefix
-        if _has_any_date_prefix(original):
+        # Already has date prefix（前缀至少 9 个字符 'YYYYMMDD_'，更短的名字不必进正则）
+        if len(original) >= 9 and _has_prefix(original):
             item.status = 'skip_prefix'
             item.final_name = original
             item.summary = t['summary_skip_prefix']
             items.append(item)
             continue
 
-        date_prefix, note_code = _get_date_prefix(p, opts.date_source)
+        # 只看 st_nlink > 1 的文件；stat 结果由 DirEntry 缓存，取日期时直接复用。
+        # Windows 上 DirEntry.stat() 不填 st_ino/st_nlink（为 0），自然不参与
+        if skip_hardlinks and entry is not None:
+            try:
+                st = entry.stat()
+                if st.st_nlink > 1 and st.st_ino:
+                    ino_key = (st.st_dev, st.st_ino)
+                    if ino_key in seen_inodes:
+                        item.status = 'skip_hardlink'
+                        item.final_name = original
+                        item.summary = t['summary_skip_hardlink']
+                        items.append(item)
+                        continue
+                    seen_inodes.add(ino_key)
+            except OSError:
+                pass
+
+        date_prefix, note_code = _date_prefix(p, opts.date_source, entry)
         if not date_prefix:
             item.status = 'error'
             item.final_name = original
@@ -1103,22 +1448,29 @@ def _build_rename_plan(
 
         existing_keys = existing_keys_by_dir.get(parent)
         if existing_keys is None:
-            try:
-                existing_names = os.listdir(parent)
-            except Exception as e:
-                existing_names = []
-                scan_errors.append(f"listdir {parent}: {e}")
-            existing_keys = {_name_key(n) for n in existing_names}
+            existing_names = dir_names.get(parent)
+            if existing_names is None:
+                # 单文件模式（或路径写法与扫描时不一致）才回退到 listdir
+                try:
+                    existing_names = _listdir(parent)
+                except Exception as e:
+                    existing_names = []
+                    scan_errors.append(f"listdir {parent}: {e}")
+            existing_keys = {_key(n) for n in existing_names}
             existing_keys_by_dir[parent] = existing_keys
 
         reserved_keys = reserved_keys_by_dir.setdefault(parent, set())
 
+        # 同目录同 base 的下一个可用序号：被占用的名字只增不减（被改名释放的旧名
+        # 不带日期前缀，不可能是 base_NNN），所以从上次的序号接着试即可
+        next_key = (parent, _key(base_name))
         try:
-            final_name, idx = _resolve_conflict_auto_index(
+            final_name, idx = _resolve(
                 base_name,
                 existing_keys,
                 reserved_keys,
-                key_func=_name_key,
+                key_func=_key,
+                start=next_index.get(next_key, 1),
             )
         except Exception as e:
             item.status = 'error'
@@ -1130,11 +1482,13 @@ def _build_rename_plan(
 
         item.final_name = final_name
         item.conflict_index = idx
+        if idx:
+            next_index[next_key] = idx + 1
 
-        # Reserve + simulate apply
-        reserved_keys.add(_name_key(final_name))
-        existing_keys.discard(_name_key(original))
-        existing_keys.add(_name_key(final_name))
+        # Reserve only: candidates always carry a date prefix and originals never do
+        # (prefixed files are skipped above), so the old name can never be a
+        # candidate and existing_keys needs no simulated discard/add.
+        reserved_keys.add(_key(final_name))
 
         # Summary
         summary_parts = [t['summary_prefix_source'].format(
@@ -1160,6 +1514,8 @@ _HISTORY_DIRNAME = '.file_auto_rename'
 _HISTORY_DB_FILENAME = 'history.db'
 _HISTORY_JSON_FILENAME = 'history.json'  # legacy (will be migrated)
 _HISTORY_MAX_ENTRIES = 30
+# 本进程里已建好表/开过 WAL 的数据库路径：之后的连接只设每连接的 pragma
+_HISTORY_SCHEMA_READY: set[str] = set()
 
 
 def _history_dir_path() -> Path:
@@ -1203,9 +1559,15 @@ def _init_history_db(conn: sqlite3.Connection) -> None:
 
 
 def _with_history_conn() -> sqlite3.Connection:
-    db = _history_db_path()
-    conn = sqlite3.connect(str(db))
-    _init_history_db(conn)
+    db = str(_history_db_path())
+    conn = sqlite3.connect(db)
+    if db in _HISTORY_SCHEMA_READY:
+        # journal_mode=WAL 写在库文件里，建表也只需一次；这两项是连接级的，每次都要设
+        conn.execute('PRAGMA synchronous=NORMAL;')
+        conn.execute('PRAGMA busy_timeout=2000;')
+    else:
+        _init_history_db(conn)
+        _HISTORY_SCHEMA_READY.add(db)
     return conn
 
 
@@ -1287,20 +1649,21 @@ def _load_history() -> list[dict]:
 def _append_history_entry(entry: dict) -> None:
     """Append a history entry (sqlite transaction)."""
     _migrate_history_json_to_db_if_needed()
+    entry_id = str(entry.get('id') or uuid4())
+    entry = dict(entry)
+    entry['id'] = entry_id
+    created_at = str(entry.get('created_at') or datetime.now().isoformat(timespec='seconds'))
+    entry['created_at'] = created_at
+    status = str(entry.get('status') or 'done')
+    # 先在事务外序列化成紧凑 JSON（ops 可能有上万条），写锁只覆盖一条 INSERT
+    entry_json = json.dumps(entry, ensure_ascii=False, separators=(',', ':'))
     try:
         conn = _with_history_conn()
         try:
-            entry_id = str(entry.get('id') or uuid4())
-            entry = dict(entry)
-            entry['id'] = entry_id
-            created_at = str(entry.get('created_at') or datetime.now().isoformat(timespec='seconds'))
-            entry['created_at'] = created_at
-            status = str(entry.get('status') or 'done')
-
             with conn:
                 conn.execute(
                     'INSERT OR REPLACE INTO rename_history(entry_id, created_at, status, entry_json) VALUES (?,?,?,?)',
-                    (entry_id, created_at, status, json.dumps(entry, ensure_ascii=False)),
+                    (entry_id, created_at, status, entry_json),
                 )
                 row = conn.execute('SELECT COUNT(1) FROM rename_history').fetchone()
                 cnt = int(row[0] if row else 0)
@@ -1313,6 +1676,8 @@ def _append_history_entry(entry: dict) -> None:
         finally:
             conn.close()
     except Exception:
+        # 库文件可能被删/换掉了：下次连接重新建表
+        _HISTORY_SCHEMA_READY.clear()
         # last resort fallback to JSON
         try:
             p = _history_json_path()
@@ -1415,6 +1780,8 @@ class RoundedFrame(tk.Frame):
         self.margin = margin
 
         self._in_autosize = False
+        # 背景/阴影延迟到第一次 <Map>（真正显示）时再绘制；滚动区外的卡片不会提前光栅化
+        self._rendered = False
 
         self.canvas = tk.Canvas(self, bg=parent.cget('bg'), highlightthickness=0, bd=0)
         self.canvas.pack(fill=tk.BOTH, expand=True)
@@ -1423,6 +1790,7 @@ class RoundedFrame(tk.Frame):
         self._win_id = self.canvas.create_window(0, 0, window=self.inner_frame, anchor='nw')
 
         self.canvas.bind('<Configure>', self._on_canvas_configure)
+        self._map_bind_id = self.canvas.bind('<Map>', self._render_once, add='+')
         # 当内容高度变化时（尤其是 Entry 换行/字体变化），自动调整卡片高度
         self.inner_frame.bind('<Configure>', self._on_inner_configure)
 
@@ -1529,7 +1897,15 @@ class RoundedFrame(tk.Frame):
             height=win_h,
         )
 
-        self._draw_bg(w, h, margin)
+        if self._rendered:
+            self._draw_bg(w, h, margin)
+
+    def _render_once(self, _e=None):
+        if self._rendered:
+            return
+        self._rendered = True
+        self.canvas.unbind('<Map>', self._map_bind_id)
+        self._on_canvas_configure(None)
 
     def _draw_bg(self, w: int, h: int, m: int):
         self.canvas.delete('bg_layer')
@@ -1658,6 +2034,7 @@ class PillButton(tk.Canvas):
     config = configure  # alias
 
     @staticmethod
+    @functools.lru_cache(maxsize=64)
     def _shade(hex_color: str, factor: float) -> str:
         """Return a darker shade of a hex color. factor < 1 darker, > 1 lighter."""
         try:
@@ -1672,7 +2049,21 @@ class PillButton(tk.Canvas):
         except Exception:
             return hex_color
 
-    def _pill_points(self, w: int, h: int, r: int, pad: int = 1) -> list[int]:
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _pill_shape(w: int, h: int, r: int) -> tuple[tuple[int, ...], tuple[int, ...]]:
+        """(w, h, r) -> (pill points, shadow points)；同尺寸按钮共用一份几何数据。
+
+        有上限的 LRU：拖动窗口时可伸缩按钮经过的各种宽度不会一直留在内存里。
+        返回元组，缓存里的数据不会被调用方改掉。
+        """
+        pts = PillButton._pill_points(w, h, r, pad=1)
+        sdx, sdy = 0, 2
+        pts_shadow = tuple(pts[i] + (sdx if i % 2 == 0 else sdy) for i in range(len(pts)))
+        return tuple(pts), pts_shadow
+
+    @staticmethod
+    def _pill_points(w: int, h: int, r: int, pad: int = 1) -> list[int]:
         x1, y1 = pad, pad
         x2, y2 = w - pad, h - pad
         r = max(1, min(r, (x2 - x1) // 2, (y2 - y1) // 2))
@@ -1707,12 +2098,10 @@ class PillButton(tk.Canvas):
             else:
                 fill = base
 
-        pts = self._pill_points(w, h, r, pad=1)
+        pts, pts_shadow = PillButton._pill_shape(w, h, r)
 
         # subtle shadow under pill (no outline)
         if self._shadow:
-            sdx, sdy = 0, 2
-            pts_shadow = [pts[i] + (sdx if i % 2 == 0 else sdy) for i in range(len(pts))]
             self.create_polygon(
                 pts_shadow,
                 smooth=True,
@@ -1775,12 +2164,23 @@ class PillButton(tk.Canvas):
         self._on_release(e)
 
 # ------------------------- App -------------------------
+# 预览超过该行数时改为“虚拟行”：Treeview 只保留可见窗口（+缓冲）内的行
+_PREVIEW_VIRTUAL_THRESHOLD = 2000
+_PREVIEW_VIRTUAL_BUFFER = 10
+# precheck/preview 防抖：普通情况 250ms；递归扫描或上次结果很大时放宽到 400ms，连续输入只走一次目录
+_REFRESH_DEBOUNCE_MS = 250
+# 预览行分批送往 UI 线程：每批条数
+_PREVIEW_CHUNK_ROWS = 500
+_REFRESH_DEBOUNCE_HEAVY_MS = 400
+
+
 class RenameApp(_BaseTk):
     def __init__(self):
         super().__init__()
 
         # state
         self.language = 'zh'
+        self._t = _texts_for(self.language)
 
         # UI skin layer (外观集中管理，不碰重命名逻辑)
         self.skin = SkinLayer(language=self.language)
@@ -1792,6 +2192,9 @@ class RenameApp(_BaseTk):
         # options
         self.var_include_subfolders = tk.BooleanVar(value=False)
         self.var_dry_run = tk.BooleanVar(value=False)
+        self.var_parallel_rename = tk.BooleanVar(value=True)
+        self.var_verbose_log = tk.BooleanVar(value=False)
+        self.var_skip_hardlinks = tk.BooleanVar(value=False)
         self.var_date_source = tk.StringVar(value='mtime')
 
         # filters
@@ -1800,14 +2203,24 @@ class RenameApp(_BaseTk):
         self.var_filter_exclude = tk.StringVar(value='')
 
         # thread/queue
-        self._q: queue.Queue[dict] = queue.Queue()
+        # deque 的 append/popleft 在 GIL 下是原子的；GUI 端用 after() 定时取，用不到 Queue 的锁和条件变量
+        self._q: collections.deque[dict] = collections.deque()
         self._cancel_event = threading.Event()
+        # 预览/冲突预估的刷新共用一个线程池，不再每次新建线程；重命名/撤销仍走独立的
+        # daemon 线程，不会排在旧刷新后面，关窗口也不会被它们拖住退出
+        self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix='ar')
         self._worker: threading.Thread | None = None
+        self._refresh_future: concurrent.futures.Future | None = None
+        # 每次刷新一个取消事件：新刷新发起时把上一轮的置位，已在跑的扫描按目录尽快退出
+        self._refresh_cancel: threading.Event | None = None
+        # worker 入队时只置这个标志，不碰 Tk（后台线程调 Tk 可能卡在已结束的主循环上）；
+        # GUI 端的 after() 定时器只在有任务在途时存在，按标志决定下一次多快再来
+        self._q_ready = False
+        self._drain_after_id: str | None = None
 
         # precheck (conflict estimate)
         self._precheck_token: int = 0
-        self._precheck_after_id: str | None = None
-        self._preview_after_id: str | None = None
+        self._refresh_after_id: str | None = None  # precheck + preview 共用一个防抖定时器
         self._last_conflicts: list[dict] = []  # each: {folder, original, base, final}
         self._conflict_count: int | None = None
         self._precheck_inflight: bool = False
@@ -1815,7 +2228,7 @@ class RenameApp(_BaseTk):
         # diff preview state
         self._preview_token: int = 0
         self._preview_inflight: bool = False
-        self._preview_rows: list[dict] = []
+        self._preview_rows: list[PreviewRow] = []
         self._preview_dialog: tk.Toplevel | None = None
         self._preview_tree: ttk.Treeview | None = None
         self._preview_detail: tk.Text | None = None
@@ -1823,6 +2236,14 @@ class RenameApp(_BaseTk):
         self._preview_var_only_changed: tk.BooleanVar | None = None
         self._preview_var_only_conflict: tk.BooleanVar | None = None
         self._preview_count_label: tk.Label | None = None
+        self._preview_view: list[PreviewRow] = []  # 当前筛选后的行（虚拟模式下的数据源）
+        self._preview_virtual: bool = False
+        self._preview_first: int = 0
+        self._preview_heading_h: int | None = None  # 表头高度（首次有行时从 bbox 量出来）
+        self._preview_selected_idx: int | None = None
+        self._preview_focus_idx: int | None = None  # 虚拟模式重画窗口时用来恢复键盘焦点行
+        self._preview_filter_pending: bool = False
+        self._option_refresh_pending: bool = False
 
         self._init_fonts()
         self._setup_window()
@@ -1832,6 +2253,15 @@ class RenameApp(_BaseTk):
         self._update_texts()
         self._center_window()
         self._refresh_undo_state()
+        self.protocol('WM_DELETE_WINDOW', self._on_close)
+
+    def _on_close(self):
+        """Stop background work, release the worker pool, then close the window."""
+        self._cancel_event.set()
+        if self._refresh_cancel is not None:
+            self._refresh_cancel.set()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self.destroy()
 
     # ---------- fonts / style ----------
 
@@ -1843,13 +2273,8 @@ class RenameApp(_BaseTk):
 
 
 
-    def _font(self, size: int, weight: str = 'normal'):
-        return self.skin.font(size, weight)
-
-
-
     def _setup_window(self):
-        self.skin.apply_window(self, TEXTS[self.language]['title'])
+        self.skin.apply_window(self, self._t.title)
 
 
     def _center_window(self):
@@ -1891,92 +2316,64 @@ class RenameApp(_BaseTk):
     def _toggle_language(self):
         self.language = 'en' if self.language == 'zh' else 'zh'
         self.skin.language = self.language
-        self._init_ttk_style()
+        self._t = _texts_for(self.language)
+        self.skin.refresh_fonts()
         self._update_texts()
 
     def _update_texts(self):
-        t = TEXTS[self.language]
+        t = self._t
 
-        self.title(t['title'])
-        self.title_label.config(text=t['title'], font=self._font(26, 'bold'))
-        self.subtitle_label.config(text=t['subtitle'], font=self._font(12))
-
-        self.drop_area.config(text=t['drop_area'], font=self._font(13))
-        if hasattr(self, 'btn_pick_folder'):
-            self.btn_pick_folder.config(text=t.get('pick_folder', 'Choose Folder'), font=self._font(11))
-        if hasattr(self, 'btn_pick_file'):
-            self.btn_pick_file.config(text=t.get('pick_file', 'Choose File'), font=self._font(11))
-
-        self.btn_lang.config(text=t['language_switch'], font=self._font(12))
-
-        # left: options / filters
-        self.options_title.config(text=t['options'], font=self._font(13, 'bold'))
-        self.chk_subfolders.config(text=t['include_subfolders'])
-        self.chk_dryrun.config(text=t['dry_run'])
-
-        if hasattr(self, 'date_source_label'):
-            self.date_source_label.config(text=t['date_source'], font=self._font(11))
-            self.rb_mtime.config(text=t['date_source_mtime'], font=self._font(11))
-            self.rb_ctime.config(text=t['date_source_ctime'], font=self._font(11))
-            self.rb_exif.config(text=t['date_source_exif'], font=self._font(11))
-
-        self.filters_title.config(text=t['filters'], font=self._font(11, 'bold'))
-        if hasattr(self, 'btn_filters_clear'):
-            self.btn_filters_clear.config(text=t.get('filters_clear', 'Clear'), font=self._font(11, 'bold'))
-        self.lbl_filter_exts.config(text=t['filter_exts'], font=self._font(11))
-        self.lbl_filter_include.config(text=t['filter_include'], font=self._font(11))
-        self.lbl_filter_exclude.config(text=t['filter_exclude'], font=self._font(11))
-
-        self.btn_start.config(text=t['start_process'], font=self._font(14, 'bold'))
-        self.btn_cancel.config(text=t['cancel'], font=self._font(14, 'bold'))
-        self.btn_undo.config(text=t['undo_last'], font=self._font(12))
-
-        self.btn_preview_diff.config(text=t['preview_button'], font=self._font(11, 'bold'))
-        self.btn_preview_conflict.config(text=t['conflict_view'], font=self._font(11, 'bold'))
-
-        # right: preview
-        self.preview_title.config(text=t['preview_title'], font=self._font(13, 'bold'))
-        self._preview_tree.heading('old', text=t['preview_col_old'])
-        self._preview_tree.heading('new', text=t['preview_col_new'])
-        self._preview_tree.heading('summary', text=t['preview_col_summary'])
-        self.preview_chk_changed.config(text=t['preview_only_changed'])
-        self.preview_chk_conflict.config(text=t['preview_only_conflict'])
-
-        # log
-        self.log_title.config(text=t['log_title'], font=self._font(13, 'bold'))
-        self.btn_clear.config(text=t['clear_log'], font=self._font(12))
+        self.title(t.title)
+        for w, key in self._loc_bindings:
+            w.config(text=getattr(t, key))
+        for col, key in self._loc_headings:
+            self._preview_tree.heading(col, text=getattr(t, key))
 
         if not self.target_path:
-            self._set_conflict_display(t['conflict_unknown'], conflicts=[])
+            self._set_conflict_display(t.conflict_unknown, conflicts=[])
             if self._preview_count_label is not None:
-                self._preview_count_label.config(text=t['preview_no_data'], font=self._font(11))
+                self._preview_count_label.config(text=t.preview_no_data)
 
         # status
         if not self.processing:
-            self.status_label.config(text=t.get('status_idle', t.get('status_ready', 'Ready')), font=self._font(12))
+            self.status_label.config(text=t.status_idle)
 
     def _create_widgets(self):
+        # 颜色一次性取成局部变量（LOAD_FAST），避免每个控件都查全局 COLORS
+        bg_main = COLORS['bg_main']
+        text_primary = COLORS['text_primary']
+        text_secondary = COLORS['text_secondary']
+        bg_card = COLORS['bg_card']
+        bg_drop_hover = COLORS['bg_drop_hover']
+        border = COLORS['border']
+        bg_drop = COLORS['bg_drop']
+        bg_button = COLORS['bg_button']
+        bg_button_hover = COLORS['bg_button_hover']
+        text_button = COLORS['text_button']
+        bg_danger = COLORS['bg_danger']
+        bg_danger_hover = COLORS['bg_danger_hover']
+
         # Root container
-        root = tk.Frame(self, bg=COLORS['bg_main'])
+        root = tk.Frame(self, bg=bg_main)
         root.pack(fill=tk.BOTH, expand=True, padx=24, pady=20)
         root.grid_columnconfigure(0, weight=1)
         root.grid_rowconfigure(1, weight=1)
 
         # ---------------- Top bar ----------------
-        top = tk.Frame(root, bg=COLORS['bg_main'])
+        top = tk.Frame(root, bg=bg_main)
         top.grid(row=0, column=0, sticky='ew')
         top.grid_columnconfigure(0, weight=1)
 
-        left_top = tk.Frame(top, bg=COLORS['bg_main'])
+        left_top = tk.Frame(top, bg=bg_main)
         left_top.grid(row=0, column=0, sticky='w')
 
-        self.title_label = tk.Label(left_top, text='', bg=COLORS['bg_main'], fg=COLORS['text_primary'])
+        self.title_label = tk.Label(left_top, text='', bg=bg_main, fg=text_primary, font=Fonts.BODY26B)
         self.title_label.pack(anchor=tk.W)
 
-        self.subtitle_label = tk.Label(left_top, text='', bg=COLORS['bg_main'], fg=COLORS['text_secondary'])
+        self.subtitle_label = tk.Label(left_top, text='', bg=bg_main, fg=text_secondary, font=Fonts.BODY12)
         self.subtitle_label.pack(anchor=tk.W, pady=(4, 0))
 
-        right_top = tk.Frame(top, bg=COLORS['bg_main'])
+        right_top = tk.Frame(top, bg=bg_main)
         right_top.grid(row=0, column=1, sticky='e')
 
         self.btn_lang = PillButton(
@@ -1984,89 +2381,69 @@ class RenameApp(_BaseTk):
             text='',
             height=34,
             radius=17,
-            fill=COLORS['bg_card'],
-            fill_hover=COLORS['bg_drop_hover'],
-            outline=COLORS['border'],
+            fill=bg_card,
+            fill_hover=bg_drop_hover,
+            outline=border,
             outline_width=1,
-            fg=COLORS['text_secondary'],
-            font=self._font(11),
+            fg=text_secondary,
+            font=Fonts.BODY12,
             command=self._toggle_language,
         )
         self.btn_lang.pack(side=tk.RIGHT)
 
         # ---------------- Workbench ----------------
-        wb = tk.Frame(root, bg=COLORS['bg_main'])
+        wb = tk.Frame(root, bg=bg_main)
         wb.grid(row=1, column=0, sticky='nsew', pady=(16, 14))
         wb.grid_columnconfigure(0, weight=0, minsize=380)
         wb.grid_columnconfigure(1, weight=1)
         wb.grid_rowconfigure(0, weight=1)
 
         # Left (fixed width) with scrollable cards + fixed action bar
-        left_outer = tk.Frame(wb, bg=COLORS['bg_main'], width=380)
+        left_outer = tk.Frame(wb, bg=bg_main, width=380)
         left_outer.grid(row=0, column=0, sticky='nsw', padx=(0, 16))
         left_outer.grid_propagate(False)
         left_outer.grid_rowconfigure(0, weight=1)
         left_outer.grid_rowconfigure(1, weight=0)
         left_outer.grid_columnconfigure(0, weight=1)
 
-        left_scroll = tk.Frame(left_outer, bg=COLORS['bg_main'])
+        left_scroll = tk.Frame(left_outer, bg=bg_main)
         left_scroll.grid(row=0, column=0, sticky='nsew')
         left_scroll.grid_rowconfigure(0, weight=1)
         left_scroll.grid_columnconfigure(0, weight=1)
 
-        self._left_canvas = tk.Canvas(left_scroll, bg=COLORS['bg_main'], highlightthickness=0, bd=0)
+        self._left_canvas = tk.Canvas(left_scroll, bg=bg_main, highlightthickness=0, bd=0)
         self._left_canvas.grid(row=0, column=0, sticky='nsew')
 
         self._left_vsb = ttk.Scrollbar(left_scroll, orient='vertical', style='Pill.Vertical.TScrollbar', command=self._left_canvas.yview)
         self._left_vsb.grid(row=0, column=1, sticky='ns', padx=(6, 0))
         self._left_canvas.configure(yscrollcommand=self._left_vsb.set)
 
-        left = tk.Frame(self._left_canvas, bg=COLORS['bg_main'])
+        left = tk.Frame(self._left_canvas, bg=bg_main)
         self._left_window = self._left_canvas.create_window((0, 0), window=left, anchor='nw')
 
+        # 拖拽改变窗口大小时 <Configure> 会连续触发：合并到 idle 时只算一次 bbox
+        self._left_cfg_pending = False
+
         def _left_on_frame_configure(_e=None):
-            try:
-                self._left_canvas.configure(scrollregion=self._left_canvas.bbox('all'))
-            except Exception:
-                pass
+            if not self._left_cfg_pending:
+                self._left_cfg_pending = True
+                self.after_idle(self._apply_left_scrollregion)
 
         def _left_on_canvas_configure(e):
-            try:
-                self._left_canvas.itemconfigure(self._left_window, width=e.width)
-            except Exception:
-                pass
+            self._left_canvas.itemconfigure(self._left_window, width=e.width)
 
         left.bind('<Configure>', _left_on_frame_configure)
         self._left_canvas.bind('<Configure>', _left_on_canvas_configure)
 
-        def _left_on_mousewheel(e):
-            try:
-                d = getattr(e, 'delta', 0)
-                if d:
-                    self._left_canvas.yview_scroll(int(-1 * (d / 120)), 'units')
-            except Exception:
-                pass
-
-        def _left_on_wheel_up(_e):
-            try:
-                self._left_canvas.yview_scroll(-1, 'units')
-            except Exception:
-                pass
-
-        def _left_on_wheel_down(_e):
-            try:
-                self._left_canvas.yview_scroll(1, 'units')
-            except Exception:
-                pass
-
+        # 滚轮：统一挂在 'LeftScrollZone' 这个 bindtag 上，只绑定一次；
+        # 左栏所有控件在建完后插入该 tag（见 _tag_left_scroll_zone）
         self._left_canvas.bind('<Enter>', lambda _e: self._left_canvas.focus_set())
-        for _w in (self._left_canvas, left):
-            _w.bind('<MouseWheel>', _left_on_mousewheel)
-            _w.bind('<Button-4>', _left_on_wheel_up)   # Linux
-            _w.bind('<Button-5>', _left_on_wheel_down) # Linux
+        self.bind_class('LeftScrollZone', '<MouseWheel>', self._on_wheel)
+        self.bind_class('LeftScrollZone', '<Button-4>', self._on_wheel_up)    # Linux
+        self.bind_class('LeftScrollZone', '<Button-5>', self._on_wheel_down)  # Linux
 
         # Right (preview)
-        right = tk.Frame(wb, bg=COLORS['bg_main'])
+        right = tk.Frame(wb, bg=bg_main)
         right.grid(row=0, column=1, sticky='nsew')
         right.grid_rowconfigure(0, weight=3)
         right.grid_rowconfigure(1, weight=2)
@@ -2076,22 +2453,23 @@ class RenameApp(_BaseTk):
         card_drop = RoundedFrame(left, radius=16)
         card_drop.pack(fill=tk.X, pady=(0, 12))
 
-        inner = tk.Frame(card_drop.inner_frame, bg=COLORS['bg_card'], padx=14, pady=14)
+        inner = tk.Frame(card_drop.inner_frame, bg=bg_card, padx=14, pady=14)
         inner.pack(fill=tk.BOTH, expand=True)
 
         self.path_label = tk.Label(
             inner,
             text='',
-            bg=COLORS['bg_card'],
-            fg=COLORS['text_secondary'],
+            bg=bg_card,
+            fg=text_secondary,
             anchor='w',
             justify=tk.LEFT,
             wraplength=310,
+            font=Fonts.BODY12,
         )
         self.path_label.pack(fill=tk.X, pady=(0, 10))
 
         # Quick pick buttons (Folder / File)
-        pick_row = tk.Frame(inner, bg=COLORS['bg_card'])
+        pick_row = tk.Frame(inner, bg=bg_card)
         pick_row.pack(fill=tk.X, pady=(0, 10))
 
         self.btn_pick_folder = PillButton(
@@ -2099,17 +2477,17 @@ class RenameApp(_BaseTk):
             text='',
             height=42,
             radius=21,
-            fill=COLORS['bg_card'],
-            fill_hover=COLORS['bg_drop_hover'],
-            outline=COLORS['border'],
+            fill=bg_card,
+            fill_hover=bg_drop_hover,
+            outline=border,
             outline_width=1,
-            fg=COLORS['text_primary'],
-            font=self._font(11, 'bold'),
+            fg=text_primary,
+            font=Fonts.BODY11,
             command=self._choose_folder,
         )
         self.btn_pick_folder.pack(side=tk.LEFT, fill=tk.X, expand=True)
 
-        sep_lbl = tk.Label(pick_row, text='', bg=COLORS['bg_card'])
+        sep_lbl = tk.Label(pick_row, text='', bg=bg_card)
         sep_lbl.pack(side=tk.LEFT, padx=10)
 
         self.btn_pick_file = PillButton(
@@ -2117,12 +2495,12 @@ class RenameApp(_BaseTk):
             text='',
             height=42,
             radius=21,
-            fill=COLORS['bg_card'],
-            fill_hover=COLORS['bg_drop_hover'],
-            outline=COLORS['border'],
+            fill=bg_card,
+            fill_hover=bg_drop_hover,
+            outline=border,
             outline_width=1,
-            fg=COLORS['text_primary'],
-            font=self._font(11, 'bold'),
+            fg=text_primary,
+            font=Fonts.BODY11,
             command=self._choose_file,
         )
         self.btn_pick_file.pack(side=tk.LEFT, fill=tk.X, expand=True)
@@ -2130,8 +2508,8 @@ class RenameApp(_BaseTk):
         drop_box = RoundedFrame(
             inner,
             radius=18,
-            bg_color=COLORS['bg_drop'],
-            border_color=COLORS['border'],
+            bg_color=bg_drop,
+            border_color=border,
             shadow=False,
         )
         drop_box.pack(fill=tk.X, expand=False)
@@ -2139,32 +2517,31 @@ class RenameApp(_BaseTk):
         self.drop_area = tk.Label(
             drop_box.inner_frame,
             text='',
-            bg=COLORS['bg_drop'],
-            fg=COLORS['text_secondary'],
+            bg=bg_drop,
+            fg=text_secondary,
             relief=tk.FLAT,
             padx=14,
             pady=18,
             cursor='hand2',
             justify=tk.CENTER,
+            font=Fonts.BODY13,
         )
         self.drop_area.pack(fill=tk.X)
-        _bind_hover(self.drop_area, COLORS['bg_drop'], COLORS['bg_drop_hover'])
+        _bind_hover(self.drop_area, bg_drop, bg_drop_hover)
         self.drop_area.bind('<Button-1>', lambda _e: self._on_click_select())
 
-        try:
+        if _HAS_DND:
             self.drop_area.drop_target_register(DND_FILES)
             self.drop_area.dnd_bind('<<Drop>>', self._on_drop)
-        except Exception:
-            pass
 
         # ---- Options / Filters / Conflicts ----
         opt_card = RoundedFrame(left, radius=16)
         opt_card.pack(fill=tk.X, pady=(0, 12))
 
-        opt_inner = tk.Frame(opt_card.inner_frame, bg=COLORS['bg_card'], padx=16, pady=14)
+        opt_inner = tk.Frame(opt_card.inner_frame, bg=bg_card, padx=16, pady=14)
         opt_inner.pack(fill=tk.BOTH, expand=True)
 
-        self.options_title = tk.Label(opt_inner, text='', bg=COLORS['bg_card'], fg=COLORS['text_primary'])
+        self.options_title = tk.Label(opt_inner, text='', bg=bg_card, fg=text_primary, font=Fonts.BODY13B)
         self.options_title.pack(anchor=tk.W)
 
         self.chk_subfolders = ttk.Checkbutton(opt_inner, variable=self.var_include_subfolders, style='Card.TCheckbutton')
@@ -2173,25 +2550,34 @@ class RenameApp(_BaseTk):
         self.chk_dryrun = ttk.Checkbutton(opt_inner, variable=self.var_dry_run, style='Card.TCheckbutton')
         self.chk_dryrun.pack(anchor=tk.W, pady=(6, 0))
 
+        self.chk_parallel = ttk.Checkbutton(opt_inner, variable=self.var_parallel_rename, style='Card.TCheckbutton')
+        self.chk_parallel.pack(anchor=tk.W, pady=(6, 0))
+
+        self.chk_verbose_log = ttk.Checkbutton(opt_inner, variable=self.var_verbose_log, style='Card.TCheckbutton')
+        self.chk_verbose_log.pack(anchor=tk.W, pady=(6, 0))
+
+        self.chk_skip_hardlinks = ttk.Checkbutton(opt_inner, variable=self.var_skip_hardlinks, style='Card.TCheckbutton')
+        self.chk_skip_hardlinks.pack(anchor=tk.W, pady=(6, 0))
+
         # date source (mtime / ctime / EXIF)
         self.date_source_label = tk.Label(
-            opt_inner, text='', bg=COLORS['bg_card'], fg=COLORS['text_secondary'], font=self._font(11)
+            opt_inner, text='', bg=bg_card, fg=text_secondary, font=Fonts.BODY11
         )
         self.date_source_label.pack(anchor=tk.W, pady=(10, 0))
 
-        ds_row = tk.Frame(opt_inner, bg=COLORS['bg_card'])
+        ds_row = tk.Frame(opt_inner, bg=bg_card)
         ds_row.pack(fill=tk.X, pady=(6, 0))
 
         rb_kwargs = dict(
             variable=self.var_date_source,
-            bg=COLORS['bg_card'],
-            fg=COLORS['text_primary'],
-            activebackground=COLORS['bg_card'],
-            activeforeground=COLORS['text_primary'],
-            selectcolor=COLORS['bg_card'],
+            bg=bg_card,
+            fg=text_primary,
+            activebackground=bg_card,
+            activeforeground=text_primary,
+            selectcolor=bg_card,
             highlightthickness=0,
             bd=0,
-            font=self._font(11),
+            font=Fonts.BODY11,
         )
         self.rb_mtime = tk.Radiobutton(ds_row, value='mtime', **rb_kwargs)
         self.rb_ctime = tk.Radiobutton(ds_row, value='ctime', **rb_kwargs)
@@ -2200,17 +2586,18 @@ class RenameApp(_BaseTk):
         self.rb_ctime.pack(anchor=tk.W, pady=(0, 2))
         self.rb_exif.pack(anchor=tk.W)
 
-        sep = tk.Frame(opt_inner, bg=COLORS['border'], height=1)
+        sep = tk.Frame(opt_inner, bg=border, height=1)
         sep.pack(fill=tk.X, pady=(12, 10))
 
-        self.filters_title_row = tk.Frame(opt_inner, bg=COLORS['bg_card'])
+        self.filters_title_row = tk.Frame(opt_inner, bg=bg_card)
         self.filters_title_row.pack(fill=tk.X, pady=(0, 8))
 
         self.filters_title = tk.Label(
             self.filters_title_row,
             text='',
-            bg=COLORS['bg_card'],
-            fg=COLORS['text_primary'],
+            bg=bg_card,
+            fg=text_primary,
+            font=Fonts.BODY11B,
         )
         self.filters_title.pack(side=tk.LEFT, anchor='w')
 
@@ -2219,17 +2606,17 @@ class RenameApp(_BaseTk):
             text='',
             height=32,
             radius=16,
-            fill=COLORS['bg_card'],
-            fill_hover=COLORS['bg_drop_hover'],
-            outline=COLORS['border'],
+            fill=bg_card,
+            fill_hover=bg_drop_hover,
+            outline=border,
             outline_width=1,
-            fg=COLORS['bg_button'],
-            font=self._font(11, 'bold'),
+            fg=bg_button,
+            font=Fonts.BODY11B,
             command=self._clear_filters,
         )
         self.btn_filters_clear.pack(side=tk.RIGHT)
 
-        filters_grid = tk.Frame(opt_inner, bg=COLORS['bg_card'])
+        filters_grid = tk.Frame(opt_inner, bg=bg_card)
         filters_grid.pack(fill=tk.X)
 
         filters_grid.grid_columnconfigure(0, minsize=86)
@@ -2240,22 +2627,23 @@ class RenameApp(_BaseTk):
             ent = tk.Entry(
                 parent,
                 textvariable=var,
-                bg=COLORS['bg_card'],
-                fg=COLORS['text_primary'],
+                bg=bg_card,
+                fg=text_primary,
                 relief=tk.FLAT,
                 highlightthickness=1,
-                highlightbackground=COLORS['border'],
-                highlightcolor=COLORS['bg_button'],
-                insertbackground=COLORS['text_primary'],
+                highlightbackground=border,
+                highlightcolor=bg_button,
+                insertbackground=text_primary,
             )
             return ent
 
         self.lbl_filter_exts = tk.Label(
             filters_grid,
             text='',
-            bg=COLORS['bg_card'],
-            fg=COLORS['text_secondary'],
+            bg=bg_card,
+            fg=text_secondary,
             anchor='w',
+            font=Fonts.BODY11,
         )
         self.lbl_filter_exts.grid(row=0, column=0, sticky='w', padx=(0, 10), pady=(0, 10))
         self.ent_filter_exts = _mk_entry(filters_grid, self.var_filter_exts)
@@ -2264,9 +2652,10 @@ class RenameApp(_BaseTk):
         self.lbl_filter_include = tk.Label(
             filters_grid,
             text='',
-            bg=COLORS['bg_card'],
-            fg=COLORS['text_secondary'],
+            bg=bg_card,
+            fg=text_secondary,
             anchor='w',
+            font=Fonts.BODY11,
         )
         self.lbl_filter_include.grid(row=1, column=0, sticky='w', padx=(0, 10), pady=(0, 10))
         self.ent_filter_include = _mk_entry(filters_grid, self.var_filter_include)
@@ -2275,21 +2664,22 @@ class RenameApp(_BaseTk):
         self.lbl_filter_exclude = tk.Label(
             filters_grid,
             text='',
-            bg=COLORS['bg_card'],
-            fg=COLORS['text_secondary'],
+            bg=bg_card,
+            fg=text_secondary,
             anchor='w',
+            font=Fonts.BODY11,
         )
         self.lbl_filter_exclude.grid(row=2, column=0, sticky='w', padx=(0, 10))
         self.ent_filter_exclude = _mk_entry(filters_grid, self.var_filter_exclude)
         self.ent_filter_exclude.grid(row=2, column=1, sticky='ew')
 
-        sep2 = tk.Frame(opt_inner, bg=COLORS['border'], height=1)
+        sep2 = tk.Frame(opt_inner, bg=border, height=1)
         sep2.pack(fill=tk.X, pady=(12, 10))
 
-        conflict_row = tk.Frame(opt_inner, bg=COLORS['bg_card'])
+        conflict_row = tk.Frame(opt_inner, bg=bg_card)
         conflict_row.pack(fill=tk.X)
 
-        self.conflict_label = tk.Label(conflict_row, text='', bg=COLORS['bg_card'], fg=COLORS['text_secondary'])
+        self.conflict_label = tk.Label(conflict_row, text='', bg=bg_card, fg=text_secondary, font=Fonts.BODY11)
         self.conflict_label.pack(side=tk.LEFT)
 
         self.btn_preview_conflict = PillButton(
@@ -2297,12 +2687,12 @@ class RenameApp(_BaseTk):
             text='',
             height=30,
             radius=15,
-            fill=COLORS['bg_card'],
-            fill_hover=COLORS['bg_drop_hover'],
-            outline=COLORS['border'],
+            fill=bg_card,
+            fill_hover=bg_drop_hover,
+            outline=border,
             outline_width=1,
-            fg=COLORS['bg_button'],
-            font=self._font(11, 'bold'),
+            fg=bg_button,
+            font=Fonts.BODY11B,
             command=self._open_conflict_preview,
         )
         self.btn_preview_conflict.pack(side=tk.RIGHT, padx=(10, 0))
@@ -2312,21 +2702,23 @@ class RenameApp(_BaseTk):
             text='',
             height=30,
             radius=15,
-            fill=COLORS['bg_card'],
-            fill_hover=COLORS['bg_drop_hover'],
-            outline=COLORS['border'],
+            fill=bg_card,
+            fill_hover=bg_drop_hover,
+            outline=border,
             outline_width=1,
-            fg=COLORS['bg_button'],
-            font=self._font(11, 'bold'),
+            fg=bg_button,
+            font=Fonts.BODY11B,
             command=self._open_diff_preview,
         )
         self.btn_preview_diff.pack(side=tk.RIGHT)
 
+        self._tag_left_scroll_zone(self._left_canvas)
+
         # ---- Actions (fixed bottom) ----
         act_card = RoundedFrame(left_outer, radius=16)
         act_card.grid(row=1, column=0, sticky='ew', pady=(12, 0))
 
-        act = tk.Frame(act_card.inner_frame, bg=COLORS['bg_card'], padx=16, pady=14)
+        act = tk.Frame(act_card.inner_frame, bg=bg_card, padx=16, pady=14)
         act.pack(fill=tk.BOTH, expand=True)
 
         # 主按钮：白底 + 彩色描边（更接近参考 UI 的“胶囊”风格）
@@ -2335,12 +2727,12 @@ class RenameApp(_BaseTk):
             text='',
             height=54,
             radius=27,
-            fill=COLORS['bg_button'],
-            fill_hover=COLORS['bg_button_hover'],
+            fill=bg_button,
+            fill_hover=bg_button_hover,
             outline='',
             outline_width=0,
-            fg=COLORS['text_button'],
-            font=self._font(13, 'bold'),
+            fg=text_button,
+            font=Fonts.BODY14B,
             state=tk.DISABLED,
             command=self._start_processing,
         )
@@ -2351,12 +2743,12 @@ class RenameApp(_BaseTk):
             text='',
             height=54,
             radius=27,
-            fill=COLORS['bg_danger'],
-            fill_hover=COLORS['bg_danger_hover'],
+            fill=bg_danger,
+            fill_hover=bg_danger_hover,
             outline='',
             outline_width=0,
-            fg=COLORS['text_button'],
-            font=self._font(13, 'bold'),
+            fg=text_button,
+            font=Fonts.BODY14B,
             state=tk.DISABLED,
             command=self._cancel_processing,
         )
@@ -2367,12 +2759,12 @@ class RenameApp(_BaseTk):
             text='',
             height=50,
             radius=25,
-            fill=COLORS['bg_drop'],
-            fill_hover=COLORS['bg_drop_hover'],
+            fill=bg_drop,
+            fill_hover=bg_drop_hover,
             outline='',
             outline_width=0,
-            fg=COLORS['text_primary'],
-            font=self._font(12),
+            fg=text_primary,
+            font=Fonts.BODY12,
             state=tk.DISABLED,
             command=self._start_undo,
         )
@@ -2381,22 +2773,22 @@ class RenameApp(_BaseTk):
         # ---- Right: Preview (always visible) ----
         preview_card = RoundedFrame(right, radius=16, autosize=False)
         preview_card.grid(row=0, column=0, sticky='nsew')
-        prev = tk.Frame(preview_card.inner_frame, bg=COLORS['bg_card'], padx=12, pady=12)
+        prev = tk.Frame(preview_card.inner_frame, bg=bg_card, padx=12, pady=12)
         prev.pack(fill=tk.BOTH, expand=True)
         prev.grid_rowconfigure(2, weight=1)
         prev.grid_columnconfigure(0, weight=1)
 
-        header = tk.Frame(prev, bg=COLORS['bg_card'])
+        header = tk.Frame(prev, bg=bg_card)
         header.grid(row=0, column=0, sticky='ew')
         header.grid_columnconfigure(0, weight=1)
 
-        self.preview_title = tk.Label(header, text='', bg=COLORS['bg_card'], fg=COLORS['text_primary'])
+        self.preview_title = tk.Label(header, text='', bg=bg_card, fg=text_primary, font=Fonts.BODY13B)
         self.preview_title.grid(row=0, column=0, sticky='w')
 
-        self._preview_count_label = tk.Label(header, text='', bg=COLORS['bg_card'], fg=COLORS['text_secondary'])
+        self._preview_count_label = tk.Label(header, text='', bg=bg_card, fg=text_secondary, font=Fonts.BODY11)
         self._preview_count_label.grid(row=0, column=1, sticky='e')
 
-        tb = tk.Frame(prev, bg=COLORS['bg_card'])
+        tb = tk.Frame(prev, bg=bg_card)
         tb.grid(row=1, column=0, sticky='ew', pady=(10, 10))
         tb.grid_columnconfigure(0, weight=1)
 
@@ -2407,13 +2799,13 @@ class RenameApp(_BaseTk):
         self.preview_search = tk.Entry(
             tb,
             textvariable=self._preview_var_query,
-            bg=COLORS['bg_card'],
-            fg=COLORS['text_primary'],
+            bg=bg_card,
+            fg=text_primary,
             relief=tk.FLAT,
             highlightthickness=1,
-            highlightbackground=COLORS['border'],
-            highlightcolor=COLORS['bg_button'],
-            insertbackground=COLORS['text_primary'],
+            highlightbackground=border,
+            highlightcolor=bg_button,
+            insertbackground=text_primary,
         )
         self.preview_search.grid(row=0, column=0, sticky='ew')
 
@@ -2423,25 +2815,28 @@ class RenameApp(_BaseTk):
         self.preview_chk_conflict = ttk.Checkbutton(tb, variable=self._preview_var_only_conflict, style='Card.TCheckbutton')
         self.preview_chk_conflict.grid(row=0, column=2, sticky='e', padx=(10, 0))
 
-        table = tk.Frame(prev, bg=COLORS['bg_card'])
+        table = tk.Frame(prev, bg=bg_card)
         table.grid(row=2, column=0, sticky='nsew')
         table.grid_rowconfigure(0, weight=1)
         table.grid_columnconfigure(0, weight=1)
 
-        columns = ('old', 'new', 'summary')
-        tree = ttk.Treeview(table, columns=columns, show='headings', selectmode='browse')
+        # (列 id, 标题文本 key, 宽度)：标题在构建时直接写入当前语言，不再先置空再由 _update_texts 覆盖
+        column_specs = (
+            ('old', 'preview_col_old', 340),
+            ('new', 'preview_col_new', 520),
+            ('summary', 'preview_col_summary', 200),
+        )
+        tree = ttk.Treeview(table, columns=tuple(c for c, _k, _w in column_specs), show='headings', selectmode='browse')
         self._preview_tree = tree
 
-        tree.heading('old', text='')
-        tree.heading('new', text='')
-        tree.heading('summary', text='')
+        t = self._t
+        for col, key, width in column_specs:
+            tree.heading(col, text=getattr(t, key))
+            tree.column(col, width=width, anchor='w')
 
-        tree.column('old', width=340, anchor='w')
-        tree.column('new', width=520, anchor='w')
-        tree.column('summary', width=200, anchor='w')
-
-        vsb = ttk.Scrollbar(table, orient='vertical', style='Pill.Vertical.TScrollbar', command=tree.yview)
-        tree.configure(yscrollcommand=vsb.set)
+        vsb = ttk.Scrollbar(table, orient='vertical', style='Pill.Vertical.TScrollbar', command=self._preview_yview)
+        self._preview_vsb = vsb
+        tree.configure(yscrollcommand=self._preview_on_tree_yscroll)
 
         tree.grid(row=0, column=0, sticky='nsew')
         vsb.grid(row=0, column=1, sticky='ns')
@@ -2449,45 +2844,33 @@ class RenameApp(_BaseTk):
         try:
             tree.tag_configure('rename', background='#FFFBEB')
             tree.tag_configure('conflict', background='#FFF1F0')
-            tree.tag_configure('skip', foreground=COLORS['text_secondary'])
+            tree.tag_configure('skip', foreground=text_secondary)
         except Exception:
             pass
 
         tree.bind('<<TreeviewSelect>>', self._preview_on_select)
+        tree.bind('<Configure>', lambda _e: self._preview_virtual and self._preview_render_window())
+        tree.bind('<MouseWheel>', lambda e: self._preview_virtual_wheel(-3 if e.delta > 0 else 3))
+        tree.bind('<Button-4>', lambda _e: self._preview_virtual_wheel(-3))
+        tree.bind('<Button-5>', lambda _e: self._preview_virtual_wheel(3))
 
-        detail = tk.Text(
-            prev,
-            height=4,
-            bg=COLORS['bg_card'],
-            fg=COLORS['text_primary'],
-            relief=tk.FLAT,
-            borderwidth=0,
-            wrap=tk.WORD,
-            padx=10,
-            pady=8,
-        )
-        self._preview_detail = detail
-        detail.grid(row=3, column=0, sticky='ew', pady=(12, 0))
-        detail.tag_config('title', font=self._font(10, 'bold'), foreground=COLORS['text_primary'])
-        detail.tag_config('muted', font=self._font(10), foreground=COLORS['text_secondary'])
-        detail.tag_config('diff_old', background='#FFE5E5')
-        detail.tag_config('diff_new', background='#E8FFF1')
-        detail.configure(state=tk.DISABLED)
+        # 详情区（高亮 diff）延迟到第一次选中行时再创建：见 _ensure_preview_detail
+        self._preview_parent = prev
 
-        self._preview_var_query.trace_add('write', lambda *_: self._preview_apply_filters())
-        self._preview_var_only_changed.trace_add('write', lambda *_: self._preview_apply_filters())
-        self._preview_var_only_conflict.trace_add('write', lambda *_: self._preview_apply_filters())
+        self._preview_var_query.trace_add('write', self._preview_filter_kick)
+        self._preview_var_only_changed.trace_add('write', self._preview_filter_kick)
+        self._preview_var_only_conflict.trace_add('write', self._preview_filter_kick)
 
         # ---------------- Right: Log card (aligned under preview) ----------------
         log_card = RoundedFrame(right, radius=16, autosize=False)
         log_card.grid(row=1, column=0, sticky='nsew', pady=(12, 0))
-        log_inner = tk.Frame(log_card.inner_frame, bg=COLORS['bg_card'], padx=14, pady=12)
+        log_inner = tk.Frame(log_card.inner_frame, bg=bg_card, padx=14, pady=12)
         log_inner.pack(fill=tk.BOTH, expand=True)
 
-        title_row = tk.Frame(log_inner, bg=COLORS['bg_card'])
+        title_row = tk.Frame(log_inner, bg=bg_card)
         title_row.pack(fill=tk.X)
 
-        self.log_title = tk.Label(title_row, text='', bg=COLORS['bg_card'], fg=COLORS['text_primary'])
+        self.log_title = tk.Label(title_row, text='', bg=bg_card, fg=text_primary, font=Fonts.BODY13B)
         self.log_title.pack(side=tk.LEFT)
 
         self.btn_clear = PillButton(
@@ -2495,19 +2878,89 @@ class RenameApp(_BaseTk):
             text='',
             height=30,
             radius=15,
-            fill=COLORS['bg_card'],
-            fill_hover=COLORS['bg_drop_hover'],
-            outline=COLORS['border'],
+            fill=bg_card,
+            fill_hover=bg_drop_hover,
+            outline=border,
             outline_width=1,
-            fg=COLORS['bg_button'],
-            font=self._font(11, 'bold'),
+            fg=bg_button,
+            font=Fonts.BODY12,
             command=self._clear_log,
         )
         self.btn_clear.pack(side=tk.RIGHT)
 
-        self.status_label = tk.Label(title_row, text='', bg=COLORS['bg_card'], fg=COLORS['text_secondary'])
+        self.status_label = tk.Label(title_row, text='', bg=bg_card, fg=text_secondary, font=Fonts.BODY12)
         self.status_label.pack(side=tk.RIGHT, padx=(0, 10))
 
+        # 进度条 + 日志正文延迟到第一次使用时再创建：见 _ensure_log_card
+        self._log_inner = log_inner
+        self.progress: ttk.Progressbar | None = None
+        self.log_text: tk.Text | None = None
+
+        # 多语言文本绑定：建好控件时一次性登记，_update_texts 只需遍历
+        self._loc_bindings: list[tuple[tk.Misc, str]] = [
+            (self.title_label, 'title'),
+            (self.subtitle_label, 'subtitle'),
+            (self.drop_area, 'drop_area'),
+            (self.btn_pick_folder, 'pick_folder'),
+            (self.btn_pick_file, 'pick_file'),
+            (self.btn_lang, 'language_switch'),
+            (self.options_title, 'options'),
+            (self.chk_subfolders, 'include_subfolders'),
+            (self.chk_dryrun, 'dry_run'),
+            (self.chk_parallel, 'parallel_rename'),
+            (self.chk_verbose_log, 'verbose_log'),
+            (self.chk_skip_hardlinks, 'skip_hardlinks'),
+            (self.date_source_label, 'date_source'),
+            (self.rb_mtime, 'date_source_mtime'),
+            (self.rb_ctime, 'date_source_ctime'),
+            (self.rb_exif, 'date_source_exif'),
+            (self.filters_title, 'filters'),
+            (self.btn_filters_clear, 'filters_clear'),
+            (self.lbl_filter_exts, 'filter_exts'),
+            (self.lbl_filter_include, 'filter_include'),
+            (self.lbl_filter_exclude, 'filter_exclude'),
+            (self.btn_start, 'start_process'),
+            (self.btn_cancel, 'cancel'),
+            (self.btn_undo, 'undo_last'),
+            (self.btn_preview_diff, 'preview_button'),
+            (self.btn_preview_conflict, 'conflict_view'),
+            (self.preview_title, 'preview_title'),
+            (self.preview_chk_changed, 'preview_only_changed'),
+            (self.preview_chk_conflict, 'preview_only_conflict'),
+            (self.log_title, 'log_title'),
+            (self.btn_clear, 'clear_log'),
+        ]
+        self._loc_headings: list[tuple[str, str]] = [(col, key) for col, key, _w in column_specs]
+
+    def _tag_left_scroll_zone(self, widget: tk.Misc):
+        """Prepend the 'LeftScrollZone' bindtag to widget and all of its descendants."""
+        tags = widget.bindtags()
+        if 'LeftScrollZone' not in tags:
+            widget.bindtags(('LeftScrollZone',) + tags)
+        for child in widget.winfo_children():
+            self._tag_left_scroll_zone(child)
+
+    def _apply_left_scrollregion(self):
+        self._left_cfg_pending = False
+        # after_idle 回调可能晚于窗口销毁：用 winfo_exists 判断，不走异常路径
+        if self._left_canvas.winfo_exists():
+            self._left_canvas.configure(scrollregion=self._left_canvas.bbox('all'))
+
+    def _on_wheel(self, e):
+        self._left_canvas.yview_scroll(-1 if e.delta > 0 else 1, 'units')
+
+    def _on_wheel_up(self, _e):
+        self._left_canvas.yview_scroll(-1, 'units')
+
+    def _on_wheel_down(self, _e):
+        self._left_canvas.yview_scroll(1, 'units')
+
+    def _ensure_log_card(self):
+        """Build the progress bar and log text on first use (cold start only shows the title row)."""
+        if self.log_text is not None:
+            return
+        log_inner = self._log_inner
+
         self.progress = ttk.Progressbar(log_inner, mode='determinate')
         self.progress.pack(fill=tk.X, pady=(10, 10))
 
@@ -2546,11 +2999,35 @@ class RenameApp(_BaseTk):
         self.log_text.tag_config('info', foreground=COLORS['text_primary'])
         self.log_text.tag_config('preview', foreground=COLORS['warning'])
 
+    def _ensure_preview_detail(self):
+        """Build the diff detail pane under the preview table on first row selection."""
+        if self._preview_detail is not None:
+            return
+        detail = tk.Text(
+            self._preview_parent,
+            height=4,
+            bg=COLORS['bg_card'],
+            fg=COLORS['text_primary'],
+            relief=tk.FLAT,
+            borderwidth=0,
+            wrap=tk.WORD,
+            padx=10,
+            pady=8,
+        )
+        self._preview_detail = detail
+        detail.grid(row=3, column=0, sticky='ew', pady=(12, 0))
+        detail.tag_config('title', font=Fonts.BODY10B, foreground=COLORS['text_primary'])
+        detail.tag_config('muted', font=Fonts.BODY10, foreground=COLORS['text_secondary'])
+        detail.tag_config('diff_old', background='#FFE5E5')
+        detail.tag_config('diff_new', background='#E8FFF1')
+        detail.configure(state=tk.DISABLED)
+
     def _setup_traces(self):
         # re-calc conflict estimate when options/filters change
         vars_to_watch = [
             self.var_include_subfolders,
             self.var_dry_run,
+            self.var_skip_hardlinks,
             self.var_date_source,
             self.var_filter_exts,
             self.var_filter_include,
@@ -2558,16 +3035,28 @@ class RenameApp(_BaseTk):
         ]
         for v in vars_to_watch:
             try:
-                v.trace_add('write', lambda *_args: (self._schedule_precheck(), self._schedule_preview()))
+                v.trace_add('write', self._on_option_changed)
             except Exception:
                 pass
 
+    def _on_option_changed(self, *_args):
+        """选项/过滤器变量的统一回调：同一轮事件里的多次写入只触发一次刷新。"""
+        if self._option_refresh_pending:
+            return
+        self._option_refresh_pending = True
+        self.after_idle(self._option_refresh_run)
+
+    def _option_refresh_run(self):
+        self._option_refresh_pending = False
+        self._schedule_precheck()
+        self._schedule_preview()
+
     def _set_conflict_display(self, text: str, conflicts: list[dict] | None = None):
         if conflicts is not None:
             self._last_conflicts = conflicts
             self._conflict_count = len(conflicts)
 
-        self.conflict_label.config(text=text, font=self._font(11))
+        self.conflict_label.config(text=text)
         if self.target_path and (not self.processing):
             self.btn_preview_diff.config(state=tk.NORMAL)
         else:
@@ -2582,26 +3071,18 @@ class RenameApp(_BaseTk):
         if self.processing:
             return
 
-        t = TEXTS[self.language]
+        t = self._t
 
         if not self.target_path:
             self._last_conflicts = []
             self._conflict_count = None
-            self._set_conflict_display(t['conflict_unknown'], conflicts=[])
+            self._set_conflict_display(t.conflict_unknown, conflicts=[])
             return
 
-        # debounce
-        if self._precheck_after_id:
-            try:
-                self.after_cancel(self._precheck_after_id)
-            except Exception:
-                pass
-            self._precheck_after_id = None
-
-        self.conflict_label.config(text=t['conflict_calc'], font=self._font(11))
+        self.conflict_label.config(text=t.conflict_calc)
         self.btn_preview_conflict.config(state=tk.DISABLED)
 
-        self._precheck_after_id = self.after(250, self._run_precheck_async)
+        self._schedule_refresh()
 
     def _schedule_preview(self):
         """预览刷新防抖：避免输入时频繁启动线程。"""
@@ -2612,70 +3093,153 @@ class RenameApp(_BaseTk):
             self._preview_set_data([])
             return
 
-        if getattr(self, '_preview_after_id', None):
-            try:
-                self.after_cancel(self._preview_after_id)
-            except Exception:
-                pass
-            self._preview_after_id = None
-
-        t = TEXTS[self.language]
+        t = self._t
         if self._preview_count_label is not None:
-            self._preview_count_label.config(text=t['preview_calculating'], font=self._font(11))
+            self._preview_count_label.config(text=t.preview_calculating)
+
+        self._schedule_refresh()
 
-        self._preview_after_id = self.after(250, self._start_preview_async)
+    def _schedule_refresh(self):
+        """(Re)arm the single debounce timer that kicks both precheck and preview.
 
-    def _run_precheck_async(self):
+        The delay grows for heavier scans (subfolders, or a large previous
+        result) so fast typing in the filter entries coalesces into one walk.
+        Tokens are only bumped when the timer fires, so in-flight results are
+        still discarded correctly.
+        """
+        if self._refresh_after_id:
+            self.after_cancel(self._refresh_after_id)
+        heavy = bool(self.var_include_subfolders.get()) or len(self._preview_rows) > _PREVIEW_VIRTUAL_THRESHOLD
+        delay = _REFRESH_DEBOUNCE_HEAVY_MS if heavy else _REFRESH_DEBOUNCE_MS
+        self._refresh_after_id = self.after(delay, self._run_refresh_async)
+
+    def _run_refresh_async(self):
+        """Launch one worker that scans once and answers both precheck and preview."""
+        self._refresh_after_id = None
         if self.processing or not self.target_path:
             return
 
+        # 两个 token 各自独立：任一侧都可以单独作废在途结果
         self._precheck_token += 1
-        token = self._precheck_token
+        pre_token = self._precheck_token
+        self._preview_token += 1
+        prev_token = self._preview_token
 
-        opts = RenameOptions(
-            include_subfolders=bool(self.var_include_subfolders.get()),
-            dry_run=False,
-            date_source=str(self.var_date_source.get()).strip() or 'mtime',
-            filter_exts=str(self.var_filter_exts.get()).strip(),
-            filter_include=str(self.var_filter_include.get()).strip(),
-            filter_exclude=str(self.var_filter_exclude.get()).strip(),
-        )
-        th = threading.Thread(
-            target=self._precheck_worker,
-            args=(token, self.target_path, self.is_single_file, opts),
-            daemon=True,
-        )
+        # options snapshot (same as rename run)
+        opts = self._snapshot_options()
+
+        # show calculating state
+        t = self._t
+        if self._preview_count_label is not None:
+            self._preview_count_label.config(text=t.preview_calculating)
+
+        # clear table
+        if self._preview_tree is not None:
+            kids = self._preview_tree.get_children('')
+            if kids:
+                self._preview_tree.delete(*kids)
+
+        if self._preview_detail is not None:
+            self._preview_detail.configure(state=tk.NORMAL)
+            self._preview_detail.delete('1.0', tk.END)
+            self._preview_detail.insert(tk.END, t.preview_calculating, 'muted')
+            self._preview_detail.configure(state=tk.DISABLED)
+
+        # 还没开始跑的旧刷新直接取消；已在跑的由取消事件叫停（结果本来也会按 token 丢弃）
+        if self._refresh_future is not None:
+            self._refresh_future.cancel()
+        if self._refresh_cancel is not None:
+            self._refresh_cancel.set()
+        cancel_event = self._refresh_cancel = threading.Event()
         self._precheck_inflight = True
-        th.start()
+        self._preview_inflight = True
+        self._refresh_future = self._pool.submit(
+            self._refresh_worker, pre_token, prev_token, self.target_path, self.is_single_file, opts, cancel_event,
+        )
 
         # ensure queue is drained even when not processing
-        self.after(60, self._drain_queue)
+        self._schedule_drain(60)
 
-    def _precheck_worker(self, token: int, target_path: str, is_single_file: bool, opts: RenameOptions):
-        """Estimate conflicts based on a single RenamePlan."""
+    def _refresh_worker(
+        self,
+        pre_token: int,
+        prev_token: int,
+        target_path: str,
+        is_single_file: bool,
+        opts: RenameOptions,
+        cancel_event: threading.Event,
+    ):
+        """Build one RenamePlan and derive both the conflict estimate and the preview rows."""
         try:
             plan = _build_rename_plan(
                 target_path=target_path,
                 is_single_file=is_single_file,
                 opts=opts,
                 language=self.language,
+                cancel_event=cancel_event,
             )
+            if plan.cancelled:
+                self._q_put({'type': 'refresh_cancelled', 'pre_token': pre_token, 'prev_token': prev_token})
+                return
 
             conflicts: list[dict] = []
+            rows: list[PreviewRow] = []
+            sent_any = False
+            _matcher = difflib.SequenceMatcher
             for it in plan.items:
-                if it.status != 'rename':
-                    continue
-                if (it.conflict_index or 0) > 0 and it.base_name and it.final_name:
+                final = it.final_name or it.original_name
+                conflict = (it.conflict_index or 0) > 0
+                folder = str(it.path.parent)
+                if it.status == 'rename' and conflict and it.base_name and it.final_name:
                     conflicts.append({
-                        'folder': str(it.path.parent),
+                        'folder': folder,
                         'original': it.original_name,
                         'base': it.base_name,
                         'final': it.final_name,
                     })
-
-            self._q_put({'type': 'precheck', 'token': token, 'conflicts': conflicts})
+                changed = final != it.original_name
+                rows.append(PreviewRow(
+                    it.original_name,
+                    final,
+                    it.summary or it.error or '',
+                    (it.status == 'rename') and changed,
+                    conflict,
+                    folder,
+                    f"_{it.conflict_index:03d}" if conflict else '',
+                    # 差异高亮在后台线程算好，点选行时 UI 线程不再跑 SequenceMatcher
+                    _matcher(None, it.original_name, final, autojunk=False).get_opcodes() if changed else (),
+                ))
+                # 攒够一批就先送出去：UI 边收边插入，大目录不会一次性卡住 Tk
+                if len(rows) >= _PREVIEW_CHUNK_ROWS:
+                    if cancel_event.is_set():
+                        self._q_put({'type': 'refresh_cancelled', 'pre_token': pre_token, 'prev_token': prev_token})
+                        return
+                    self._q_put({'type': 'preview_chunk', 'token': prev_token, 'rows': rows, 'first': not sent_any})
+                    sent_any = True
+                    rows = []
+
+            if rows or not sent_any:
+                self._q_put({'type': 'preview_chunk', 'token': prev_token, 'rows': rows, 'first': not sent_any})
+            self._q_put({'type': 'precheck', 'token': pre_token, 'conflicts': conflicts})
+            self._q_put({'type': 'preview_done', 'token': prev_token})
         except Exception as e:
-            self._q_put({'type': 'precheck', 'token': token, 'conflicts': [], 'error': str(e)})
+            self._q_put({'type': 'precheck', 'token': pre_token, 'conflicts': [], 'error': str(e)})
+            self._q_put({'type': 'preview_chunk', 'token': prev_token, 'rows': [], 'first': True})
+            self._q_put({'type': 'preview_done', 'token': prev_token, 'error': str(e)})
+
+    def _snapshot_options(self) -> RenameOptions:
+        """Read the option/filter variables into an immutable RenameOptions."""
+        return RenameOptions(
+            include_subfolders=bool(self.var_include_subfolders.get()),
+            dry_run=bool(self.var_dry_run.get()),
+            parallel_rename=bool(self.var_parallel_rename.get()),
+            verbose_log=bool(self.var_verbose_log.get()),
+            skip_hardlinks=bool(self.var_skip_hardlinks.get()),
+            date_source=str(self.var_date_source.get()).strip() or 'mtime',
+            filter_exts=str(self.var_filter_exts.get()).strip(),
+            filter_include=str(self.var_filter_include.get()).strip(),
+            filter_exclude=str(self.var_filter_exclude.get()).strip(),
+        )
 
     def _open_conflict_preview(self):
         """切到“只看冲突”，并在预览表格中定位。"""
@@ -2694,86 +3258,27 @@ class RenameApp(_BaseTk):
 
     def _open_diff_preview(self):
         """刷新预览（工作台右侧始终可见，无需弹窗）。"""
-        self._start_preview_async()
+        if self._refresh_after_id:
+            self.after_cancel(self._refresh_after_id)
+        self._run_refresh_async()
 
-    def _start_preview_async(self):
-        if self.processing or not self.target_path:
+    def _preview_filter_kick(self, *_args):
+        """搜索框/勾选变化：80ms 内的连续输入合并为一次筛选。"""
+        if self._preview_filter_pending:
             return
+        self._preview_filter_pending = True
+        self.after(80, self._preview_apply_filters_run)
 
-        self._preview_token += 1
-        token = self._preview_token
-
-        # options snapshot (same as rename run)
-        opts = RenameOptions(
-            include_subfolders=bool(self.var_include_subfolders.get()),
-            dry_run=bool(self.var_dry_run.get()),
-            date_source=str(self.var_date_source.get()).strip() or 'mtime',
-            filter_exts=str(self.var_filter_exts.get()).strip(),
-            filter_include=str(self.var_filter_include.get()).strip(),
-            filter_exclude=str(self.var_filter_exclude.get()).strip(),
-        )        # show calculating state
-        t = TEXTS[self.language]
-        if self._preview_count_label is not None:
-            self._preview_count_label.config(text=t['preview_calculating'], font=self._font(11))
-
-        # clear table
-        if self._preview_tree is not None:
-            for iid in self._preview_tree.get_children(''):
-                self._preview_tree.delete(iid)
-
-        if self._preview_detail is not None:
-            self._preview_detail.configure(state=tk.NORMAL)
-            self._preview_detail.delete('1.0', tk.END)
-            self._preview_detail.insert(tk.END, t['preview_calculating'], 'muted')
-            self._preview_detail.configure(state=tk.DISABLED)
-
-        th = threading.Thread(
-            target=self._preview_worker,
-            args=(token, self.target_path, self.is_single_file, opts),
-            daemon=True,
-        )
-        self._preview_inflight = True
-        th.start()
-        self.after(60, self._drain_queue)
-
-    def _preview_worker(self, token: int, target_path: str, is_single_file: bool, opts: RenameOptions):
-        """Build preview rows based on a single RenamePlan."""
-        try:
-            plan = _build_rename_plan(
-                target_path=target_path,
-                is_single_file=is_single_file,
-                opts=opts,
-                language=self.language,
-            )
-
-            rows: list[dict] = []
-            for it in plan.items:
-                final = it.final_name or it.original_name
-                conflict = (it.conflict_index or 0) > 0
-                suffix = f"_{it.conflict_index:03d}" if conflict else ''
-                rows.append({
-                    'original': it.original_name,
-                    'final': final,
-                    'summary': it.summary or it.error or '',
-                    'changed': (it.status == 'rename') and (final != it.original_name),
-                    'conflict': conflict,
-                    'folder': str(it.path.parent),
-                    'suffix': suffix,
-                })
-
-            self._q_put({'type': 'preview', 'token': token, 'rows': rows})
-        except Exception as e:
-            self._q_put({'type': 'preview', 'token': token, 'rows': [], 'error': str(e)})
+    def _preview_apply_filters_run(self):
+        self._preview_filter_pending = False
+        self._preview_apply_filters()
 
-    def _preview_set_data(self, rows: list[dict]):
+    def _preview_set_data(self, rows: list[PreviewRow]):
         self._preview_rows = rows
         self._preview_apply_filters()
 
-    def _preview_apply_filters(self):
-        if self._preview_tree is None:
-            return
-        rows = self._preview_rows or []
-
+    def _preview_row_filter(self):
+        """Return a predicate row -> bool for the current search box / checkboxes."""
         query = ''
         only_changed = True
         only_conflict = False
@@ -2785,69 +3290,239 @@ class RenameApp(_BaseTk):
         if self._preview_var_only_conflict is not None:
             only_conflict = bool(self._preview_var_only_conflict.get())
 
-        filtered: list[dict] = []
-        for r in rows:
-            if only_conflict and not r.get('conflict'):
-                continue
-            if only_changed and not r.get('changed'):
-                continue
+        def keep(r: PreviewRow) -> bool:
+            if only_conflict and not r.conflict:
+                return False
+            if only_changed and not r.changed:
+                return False
             if query:
-                hay = f"{r.get('original','')} {r.get('final','')} {r.get('summary','')} {r.get('folder','')}".lower()
+                hay = f"{r.original} {r.final} {r.summary} {r.folder}".lower()
                 if query not in hay:
-                    continue
-            filtered.append(r)
+                    return False
+            return True
+
+        return keep
+
+    def _preview_apply_filters(self):
+        if self._preview_tree is None:
+            return
+        rows = self._preview_rows or []
+        keep = self._preview_row_filter()
+        filtered = [r for r in rows if keep(r)]
+
+        # 勾选/搜索没改变可见集合（同样的行对象、同样顺序）时不重建表格，只刷新计数
+        view = self._preview_view
+        if len(filtered) == len(view) and all(map(operator.is_, filtered, view)):
+            if self._preview_count_label is not None:
+                self._preview_count_label.config(text=self._t.preview_count.format(shown=len(filtered), total=len(rows)))
+            return
 
         self._preview_populate_tree(filtered, total=len(rows))
 
-    def _preview_populate_tree(self, rows: list[dict], total: int):
+    def _preview_append_chunk(self, chunk: list[PreviewRow], first: bool):
+        """Streaming preview: append one worker batch without rebuilding the table."""
+        if first:
+            self._preview_rows = []
+            if self._preview_tree is not None:
+                self._preview_view = []
+                self._preview_first = 0
+                self._preview_selected_idx = None
+                self._preview_focus_idx = None
+                self._preview_virtual = False
+                kids = self._preview_tree.get_children('')
+                if kids:
+                    self._preview_tree.delete(*kids)
+        self._preview_rows.extend(chunk)
         if self._preview_tree is None:
             return
-        tree = self._preview_tree
 
-        # clear
-        for iid in tree.get_children(''):
-            tree.delete(iid)
+        keep = self._preview_row_filter()
+        new = [r for r in chunk if keep(r)]
+        view = self._preview_view
+        start = len(view)
+        view.extend(new)
+        if self._preview_virtual:
+            # 只有当前可见窗口还没填满时才需要重画
+            if start < self._preview_first + self._preview_visible_count() + _PREVIEW_VIRTUAL_BUFFER:
+                self._preview_render_window()
+            else:
+                n = len(view)
+                self._preview_vsb.set(self._preview_first / n, min(1.0, (self._preview_first + self._preview_visible_count()) / n))
+        elif len(view) > _PREVIEW_VIRTUAL_THRESHOLD:
+            self._preview_virtual = True
+            self._preview_render_window(rebuild=True)
+        elif new:
+            self._preview_insert_rows(new, start)
 
-        for r in rows:
-            original = r.get('original', '')
-            final = r.get('final', '')
-            summary = r.get('summary', '')
-            tag = 'skip'
-            if r.get('changed'):
-                tag = 'rename'
-            if r.get('conflict'):
-                tag = 'conflict'
-            tree.insert('', 'end', values=(original, final, summary), tags=(tag,))
+        if self._preview_count_label is not None:
+            self._preview_count_label.config(text=self._t.preview_count.format(shown=len(view), total=len(self._preview_rows)))
+
+    def _preview_populate_tree(self, rows: list[PreviewRow], total: int):
+        if self._preview_tree is None:
+            return
+        self._preview_view = rows
+        self._preview_first = 0
+        self._preview_selected_idx = None
+        self._preview_focus_idx = None
+        self._preview_virtual = len(rows) > _PREVIEW_VIRTUAL_THRESHOLD
+        if self._preview_virtual:
+            self._preview_render_window(rebuild=True)
+        else:
+            self._preview_bulk_insert(rows)
 
         # count label
         if self._preview_count_label is not None:
-            t = TEXTS[self.language]
-            self._preview_count_label.config(text=t['preview_count'].format(shown=len(rows), total=total), font=self._font(11))
+            t = self._t
+            self._preview_count_label.config(text=t.preview_count.format(shown=len(rows), total=total))
+
+        self._preview_show_detail_placeholder()
 
-        # detail default
+    def _preview_show_detail_placeholder(self):
+        rows = self._preview_view
         if self._preview_detail is not None:
             self._preview_detail.configure(state=tk.NORMAL)
             self._preview_detail.delete('1.0', tk.END)
             if rows:
-                self._preview_detail.insert(tk.END, TEXTS[self.language]['preview_subtitle'], 'muted')
+                self._preview_detail.insert(tk.END, self._t.preview_subtitle, 'muted')
             else:
-                self._preview_detail.insert(tk.END, TEXTS[self.language]['preview_no_data'], 'muted')
+                self._preview_detail.insert(tk.END, self._t.preview_no_data, 'muted')
             self._preview_detail.configure(state=tk.DISABLED)
 
+    def _preview_bulk_insert(self, rows: list[PreviewRow], start: int = 0):
+        """清空并批量插入预览行：插入期间把表格移出布局，只做一次布局/重绘。"""
+        tree = self._preview_tree
+        tree.grid_remove()
+        try:
+            kids = tree.get_children('')
+            if kids:
+                tree.delete(*kids)
+            self._preview_insert_rows(rows, start)
+        finally:
+            tree.grid()
+
+    def _preview_insert_rows(self, rows: list[PreviewRow], start: int):
+        """Append rows at the end of the tree; iid is the row's index in _preview_view."""
+        # 直接走 tk.call：跳过 Treeview.insert 每次的 kw -> 选项格式化；元组由 _tkinter 转成 Tcl list
+        tree = self._preview_tree
+        call = tree.tk.call
+        w = tree._w
+        for idx, r in enumerate(rows, start=start):
+            tag = 'skip'
+            if r.changed:
+                tag = 'rename'
+            if r.conflict:
+                tag = 'conflict'
+            call(w, 'insert', '', 'end', '-id', str(idx), '-values', (r.original, r.final, r.summary), '-tags', tag)
+
+    # ---- virtual rows (large previews) ----
+    def _preview_visible_count(self) -> int:
+        tree = self._preview_tree
+        rh = UI_METRICS.tree_rowheight
+        heading = self._preview_heading_h
+        if heading is None:
+            # 表头高度 = 第一行 bbox 的 y；还没有行（或已滚出视野）时先按一行估算，不缓存
+            heading = rh
+            kids = tree.get_children('')
+            if kids:
+                bbox = tree.bbox(kids[0])
+                if bbox:
+                    heading = self._preview_heading_h = int(bbox[1])
+        return max(1, (tree.winfo_height() - heading) // rh)
+
+    def _preview_render_window(self, rebuild: bool = False):
+        """虚拟模式：只把 [first, first + 可见行数 + 缓冲) 这一段插入 Treeview。
+
+        rebuild=True 用于整表重建（走 _preview_bulk_insert，插入期间把表格移出布局）；
+        滚动/窗口调整只替换这一小段行，不 grid_remove，避免每一步都闪烁和重新触发 Configure。
+        """
+        tree = self._preview_tree
+        rows = self._preview_view
+        n = len(rows)
+        visible = self._preview_visible_count()
+        first = max(0, min(self._preview_first, n - visible))
+        self._preview_first = first
+        end = min(n, first + visible + _PREVIEW_VIRTUAL_BUFFER)
+
+        # 行会整段删掉重插：先记下焦点行（选中行已在 _preview_selected_idx 里）
+        focus_iid = tree.focus()
+        if focus_iid:
+            self._preview_focus_idx = int(focus_iid)
+        if rebuild:
+            self._preview_bulk_insert(rows[first:end], start=first)
+        else:
+            kids = tree.get_children('')
+            if kids:
+                tree.delete(*kids)
+            self._preview_insert_rows(rows[first:end], first)
+        tree.yview_moveto(0)
+
+        # 恢复选中/焦点；由此触发的 <<TreeviewSelect>> 在 _preview_on_select 里按同一行忽略
+        sel = self._preview_selected_idx
+        if sel is not None and first <= sel < end:
+            tree.selection_set(str(sel))
+        foc = self._preview_focus_idx
+        if foc is not None and first <= foc < end:
+            tree.focus(str(foc))
+
+        if n:
+            self._preview_vsb.set(first / n, min(1.0, (first + visible) / n))
+        else:
+            self._preview_vsb.set(0.0, 1.0)
+
+    def _preview_yview(self, *args):
+        """Scrollbar command: forwards to the tree, or moves the virtual window."""
+        if not self._preview_virtual:
+            self._preview_tree.yview(*args)
+            return
+        n = len(self._preview_view)
+        visible = self._preview_visible_count()
+        if args[0] == 'moveto':
+            self._preview_first = int(float(args[1]) * n)
+        elif args[0] == 'scroll':
+            step = int(args[1]) * (visible if args[2] == 'pages' else 1)
+            self._preview_first += step
+        self._preview_render_window()
+
+    def _preview_virtual_wheel(self, step: int):
+        if not self._preview_virtual:
+            return None
+        self._preview_first += step
+        self._preview_render_window()
+        return 'break'
+
+    def _preview_on_tree_yscroll(self, first, last):
+        if not self._preview_virtual:
+            self._preview_vsb.set(first, last)
+            return
+        # 键盘上下移动到窗口边缘时 Treeview 会自己滚动：把偏移折算回数据源窗口
+        off = float(first)
+        if off > 0:
+            kids = self._preview_tree.get_children('')
+            self._preview_first += int(round(off * len(kids)))
+            self.after_idle(self._preview_render_window)
+
     def _preview_on_select(self, _event=None):
-        if self._preview_tree is None or self._preview_detail is None:
+        if self._preview_tree is None:
             return
         sel = self._preview_tree.selection()
         if not sel:
             return
         iid = sel[0]
+        if self._preview_virtual and int(iid) == self._preview_selected_idx:
+            # 虚拟窗口重画后恢复的选中：详情已经是这一行，不重复渲染
+            return
+        self._ensure_preview_detail()
+        self._preview_selected_idx = int(iid)
         vals = self._preview_tree.item(iid, 'values')
         if not vals or len(vals) < 3:
             return
         old_name, new_name, summary = vals[0], vals[1], vals[2]
-        self._preview_render_detail_diff(old_name, new_name, summary)
+        opcodes = None
+        if 0 <= self._preview_selected_idx < len(self._preview_view):
+            opcodes = self._preview_view[self._preview_selected_idx].opcodes
+        self._preview_render_detail_diff(old_name, new_name, summary, opcodes)
 
-    def _preview_render_detail_diff(self, old_name: str, new_name: str, summary: str):
+    def _preview_render_detail_diff(self, old_name: str, new_name: str, summary: str, opcodes: list | None = None):
         if self._preview_detail is None:
             return
 
@@ -2868,14 +3543,15 @@ class RenameApp(_BaseTk):
         txt.insert(tk.END, '\n')
 
         # SUMMARY
-        t = TEXTS[self.language]
-        txt.insert(tk.END, f"{t['preview_col_summary']}: ", 'muted')
+        t = self._t
+        txt.insert(tk.END, f"{t.preview_col_summary}: ", 'muted')
         txt.insert(tk.END, summary)
 
-        # Highlight diffs using SequenceMatcher
+        # Highlight diffs (opcodes normally precomputed by _refresh_worker)
         try:
-            sm = difflib.SequenceMatcher(a=old_name, b=new_name)
-            for tag, i1, i2, j1, j2 in sm.get_opcodes():
+            if opcodes is None:
+                opcodes = difflib.SequenceMatcher(a=old_name, b=new_name, autojunk=False).get_opcodes()
+            for tag, i1, i2, j1, j2 in opcodes:
                 if tag in ('delete', 'replace') and i2 > i1:
                     txt.tag_add('diff_old', f"{old_start}+{i1}c", f"{old_start}+{i2}c")
                 if tag in ('insert', 'replace') and j2 > j1:
@@ -2894,7 +3570,7 @@ class RenameApp(_BaseTk):
         if not paths:
             return
         if len(paths) > 1:
-            self._append_log(TEXTS[self.language]['drop_multi'].format(Path(paths[0]).name), 'warning')
+            self._append_log(self._t.drop_multi.format(Path(paths[0]).name), 'warning')
         self._select_path(paths[0])
 
     def _on_click_select(self, _event=None):
@@ -2902,12 +3578,12 @@ class RenameApp(_BaseTk):
             return
         from tkinter import filedialog
 
-        t = TEXTS[self.language]
-        choice = messagebox.askyesnocancel(t['select_type_title'], t['select_type_message'])
+        t = self._t
+        choice = messagebox.askyesnocancel(t.select_type_title, t.select_type_message)
         if choice is True:
-            path = filedialog.askdirectory(title=t['select_folder_title'])
+            path = filedialog.askdirectory(title=t.select_folder_title)
         elif choice is False:
-            path = filedialog.askopenfilename(title=t['select_file_title'])
+            path = filedialog.askopenfilename(title=t.select_file_title)
         else:
             return
 
@@ -2919,8 +3595,8 @@ class RenameApp(_BaseTk):
         if self.processing:
             return
         from tkinter import filedialog
-        t = TEXTS[self.language]
-        path = filedialog.askdirectory(title=t['select_folder_title'])
+        t = self._t
+        path = filedialog.askdirectory(title=t.select_folder_title)
         if path:
             self._select_path(path)
 
@@ -2928,8 +3604,8 @@ class RenameApp(_BaseTk):
         if self.processing:
             return
         from tkinter import filedialog
-        t = TEXTS[self.language]
-        path = filedialog.askopenfilename(title=t['select_file_title'])
+        t = self._t
+        path = filedialog.askopenfilename(title=t.select_file_title)
         if path:
             self._select_path(path)
 
@@ -2938,22 +3614,22 @@ class RenameApp(_BaseTk):
         return self._on_click_select()
     def _select_path(self, path_str: str):
         p = Path(path_str)
-        t = TEXTS[self.language]
+        t = self._t
 
         if not p.exists():
-            messagebox.showerror('Error', t['error_path_not_exist'].format(path_str))
+            messagebox.showerror('Error', t.error_path_not_exist.format(path_str))
             return
 
         if p.is_dir():
             self.target_path = str(p)
             self.is_single_file = False
-            self.path_label.config(text=t['selected_folder'].format(str(p)), fg=COLORS['success'], font=self._font(12))
+            self.path_label.config(text=t.selected_folder.format(str(p)), fg=COLORS['success'])
         elif p.is_file():
             self.target_path = str(p)
             self.is_single_file = True
-            self.path_label.config(text=t['selected_file'].format(p.name), fg=COLORS['success'], font=self._font(12))
+            self.path_label.config(text=t.selected_file.format(p.name), fg=COLORS['success'])
         else:
-            messagebox.showerror('Error', t['error_invalid_path'].format(path_str))
+            messagebox.showerror('Error', t.error_invalid_path.format(path_str))
             return
 
         self.btn_start.config(state=tk.NORMAL)
@@ -2966,6 +3642,7 @@ class RenameApp(_BaseTk):
 
 
     def _clear_log(self):
+        self._ensure_log_card()
         self.log_text.config(state=tk.NORMAL)
         self.log_text.delete('1.0', tk.END)
         self.log_text.config(state=tk.DISABLED)
@@ -2993,8 +3670,26 @@ class RenameApp(_BaseTk):
 
 
     def _append_log(self, msg: str, tag: str = 'info'):
+        self._append_logs([(msg, tag)])
+
+    def _append_logs(self, logs: list[tuple[str, str]]):
+        """Append several (msg, tag) lines with a single Text.insert call."""
+        if not logs:
+            return
+        self._ensure_log_card()
+        # 相邻同 tag 的行合并成一段；insert 支持 chars, tags, chars, tags... 交替传参
+        args: list[str] = []
+        run: list[str] = []
+        run_tag = logs[0][1]
+        for msg, tag in logs:
+            if tag != run_tag:
+                args += (''.join(run), run_tag)
+                run = []
+                run_tag = tag
+            run.append(msg + '\n')
+        args += (''.join(run), run_tag)
         self.log_text.config(state=tk.NORMAL)
-        self.log_text.insert(tk.END, msg + '\n', tag)
+        self.log_text.insert(tk.END, *args)
         self.log_text.see(tk.END)
         self.log_text.config(state=tk.DISABLED)
 
@@ -3028,12 +3723,12 @@ class RenameApp(_BaseTk):
         if self.processing:
             return
 
-        t = TEXTS[self.language]
+        t = self._t
         items = _load_history()
         _idx, entry = _find_last_undoable(items)
         if not entry:
             try:
-                messagebox.showinfo(t['undo_confirm_title'], t['undo_no_history'])
+                messagebox.showinfo(t.undo_confirm_title, t.undo_no_history)
             except Exception:
                 pass
             self._refresh_undo_state()
@@ -3042,7 +3737,7 @@ class RenameApp(_BaseTk):
         ops = entry.get('ops') or []
         if not isinstance(ops, list) or not ops:
             try:
-                messagebox.showinfo(t['undo_confirm_title'], t['undo_no_history'])
+                messagebox.showinfo(t.undo_confirm_title, t.undo_no_history)
             except Exception:
                 pass
             self._refresh_undo_state()
@@ -3050,7 +3745,7 @@ class RenameApp(_BaseTk):
 
         n = len(ops)
         try:
-            ok = messagebox.askyesno(t['undo_confirm_title'], t['undo_confirm_msg'].format(n=n))
+            ok = messagebox.askyesno(t.undo_confirm_title, t.undo_confirm_msg.format(n=n))
         except Exception:
             ok = False
         if not ok:
@@ -3063,20 +3758,37 @@ class RenameApp(_BaseTk):
         self.progress['maximum'] = max(n, 1)
 
         self._set_processing_ui(True)
-        self._q_put({'type': 'log', 'tag': 'info', 'msg': t['undo_started'].format(n=n)})
+        self._q_put({'type': 'log', 'tag': 'info', 'msg': t.undo_started.format(n=n)})
 
         entry_id = str(entry.get('id') or '')
-        th = threading.Thread(target=self._worker_undo, args=(entry_id, ops), daemon=True)
-        self._worker = th
-        th.start()
+        self._worker = threading.Thread(target=self._worker_undo, args=(entry_id, ops), daemon=True)
+        self._worker.start()
 
-        self.after(60, self._drain_queue)
+        self._schedule_drain(60)
 
     def _worker_undo(self, entry_id: str, ops: list[dict]):
         t = TEXTS[self.language]
         start = time.time()
         result = UndoResult(total=len(ops))
 
+        # 每个目录只 listdir 一次，存在性检查改为查集合（代替每条操作两次 exists() 的 stat）；
+        # 目录列不出来时记为 None，退回 Path.exists()
+        dir_keys: dict[str, set[str] | None] = {}
+
+        def _keys_of(parent: str) -> set[str] | None:
+            if parent not in dir_keys:
+                try:
+                    dir_keys[parent] = {_name_key(n) for n in os.listdir(parent)}
+                except OSError:
+                    dir_keys[parent] = None
+            return dir_keys[parent]
+
+        def _exists(p: Path) -> bool:
+            keys = _keys_of(str(p.parent))
+            if keys is None:
+                return p.exists()
+            return _name_key(p.name) in keys
+
         try:
             self._q_put({'type': 'progress', 'current': 0, 'total': result.total})
 
@@ -3090,13 +3802,13 @@ class RenameApp(_BaseTk):
                     new_path = Path(str(op.get('new') or ''))
                     old_path = Path(str(op.get('old') or ''))
 
-                    if not new_path.exists():
+                    if not _exists(new_path):
                         result.skipped += 1
                         self._q_put({'type': 'log', 'tag': 'skip', 'msg': t['undo_skip_missing'].format(str(new_path))})
                         self._q_put({'type': 'progress', 'current': idx, 'total': result.total})
                         continue
 
-                    if old_path.exists():
+                    if _exists(old_path):
                         result.skipped += 1
                         self._q_put({'type': 'log', 'tag': 'warning', 'msg': t['undo_skip_conflict'].format(str(old_path), str(new_path))})
                         self._q_put({'type': 'progress', 'current': idx, 'total': result.total})
@@ -3104,6 +3816,13 @@ class RenameApp(_BaseTk):
 
                     _safe_rename(new_path, old_path)
                     result.restored += 1
+                    # 同步缓存：新名字消失，旧名字出现
+                    keys = dir_keys.get(str(new_path.parent))
+                    if keys is not None:
+                        keys.discard(_name_key(new_path.name))
+                    keys = dir_keys.get(str(old_path.parent))
+                    if keys is not None:
+                        keys.add(_name_key(old_path.name))
                     self._q_put({'type': 'log', 'tag': 'success', 'msg': t['undo_success'].format(new_path.name, old_path.name)})
 
                 except Exception as e:
@@ -3131,12 +3850,12 @@ class RenameApp(_BaseTk):
             self._q_put({'type': 'undo_done', 'result': result})
 
     def _on_undo_done(self, result: UndoResult):
-        t = TEXTS[self.language]
+        t = self._t
 
         if result.cancelled:
-            self.status_label.config(text=t['status_cancelled'], font=self._font(12))
+            self.status_label.config(text=t.status_cancelled)
         else:
-            self.status_label.config(text=t['undo_dialog_title'], font=self._font(12))
+            self.status_label.config(text=t.undo_dialog_title)
 
         self._set_processing_ui(False)
         self._refresh_undo_state()
@@ -3146,10 +3865,10 @@ class RenameApp(_BaseTk):
         self._show_undo_result_dialog(result)
 
     def _show_undo_result_dialog(self, result: UndoResult):
-        t = TEXTS[self.language]
+        t = self._t
 
         dialog = tk.Toplevel(self)
-        dialog.title(t['undo_dialog_title'])
+        dialog.title(t.undo_dialog_title)
         dialog.configure(bg=COLORS['bg_main'])
         dialog.transient(self)
         dialog.grab_set()
@@ -3160,12 +3879,12 @@ class RenameApp(_BaseTk):
 
         icon = '↩'
         icon_color = COLORS['success'] if (not result.cancelled and result.errors == 0) else COLORS['warning']
-        tk.Label(outer, text=icon, font=self._font(56, 'bold'), bg=COLORS['bg_main'], fg=icon_color).pack(pady=(0, 6))
+        tk.Label(outer, text=icon, font=Fonts.BODY56B, bg=COLORS['bg_main'], fg=icon_color).pack(pady=(0, 6))
 
         tk.Label(
             outer,
-            text=t['undo_dialog_title'] if not result.cancelled else t['status_cancelled'],
-            font=self._font(22, 'bold'),
+            text=t.undo_dialog_title if not result.cancelled else t.status_cancelled,
+            font=Fonts.BODY22B,
             bg=COLORS['bg_main'],
             fg=COLORS['text_primary'],
         ).pack(pady=(0, 14))
@@ -3176,20 +3895,20 @@ class RenameApp(_BaseTk):
         inner = tk.Frame(card.inner_frame, bg=COLORS['bg_card'], padx=18, pady=16)
         inner.pack(fill=tk.X)
 
-        def row(label: str, value: str, color: str = COLORS['text_primary']):
-            r = tk.Frame(inner, bg=COLORS['bg_card'])
-            r.pack(fill=tk.X, pady=4)
-            tk.Label(r, text=label, font=self._font(13), bg=COLORS['bg_card'], fg=COLORS['text_secondary']).pack(side=tk.LEFT)
-            tk.Label(r, text=value, font=self._font(13, 'bold'), bg=COLORS['bg_card'], fg=color).pack(side=tk.RIGHT)
-
-        row(t['undo_ok_label'], str(result.restored), COLORS['success'])
-        row(t['undo_skip_label'], str(result.skipped), COLORS['warning'])
-        row(t['error_label'], str(result.errors), COLORS['error'])
-        row(t['time_label'], f"{result.elapsed:.2f}" + t['time_unit'], COLORS['text_secondary'])
+        rows = [
+            (t.undo_ok_label, str(result.restored), COLORS['success']),
+            (t.undo_skip_label, str(result.skipped), COLORS['warning']),
+            (t.error_label, str(result.errors), COLORS['error']),
+            (t.time_label, f"{result.elapsed:.2f}" + t.time_unit, COLORS['text_secondary']),
+        ]
+        inner.grid_columnconfigure(0, weight=1)
+        for r, (label, value, color) in enumerate(rows):
+            tk.Label(inner, text=label, font=Fonts.BODY13, bg=COLORS['bg_card'], fg=COLORS['text_secondary']).grid(row=r, column=0, sticky='w', pady=4)
+            tk.Label(inner, text=value, font=Fonts.BODY13B, bg=COLORS['bg_card'], fg=color).grid(row=r, column=1, sticky='e', pady=4)
 
         btn = PillButton(
             outer,
-            text=t['close'],
+            text=t.close,
             height=44,
             radius=22,
             fill=COLORS['bg_button'],
@@ -3197,7 +3916,7 @@ class RenameApp(_BaseTk):
             outline=COLORS['bg_button'],
             outline_width=0,
             fg=COLORS['text_button'],
-            font=self._font(11, 'bold'),
+            font=Fonts.BODY11B,
             command=dialog.destroy,
         )
         btn.pack(pady=(16, 0))
@@ -3258,6 +3977,7 @@ class RenameApp(_BaseTk):
             return
 
         self._progress_mode = 'rename'
+        self._ensure_log_card()
         self._clear_log()
         self._cancel_event.clear()
         self.progress['value'] = 0
@@ -3266,14 +3986,7 @@ class RenameApp(_BaseTk):
         self._set_processing_ui(True)
 
         # options snapshot
-        opts = RenameOptions(
-            include_subfolders=bool(self.var_include_subfolders.get()),
-            dry_run=bool(self.var_dry_run.get()),
-            date_source=str(self.var_date_source.get()).strip() or 'mtime',
-            filter_exts=str(self.var_filter_exts.get()).strip(),
-            filter_include=str(self.var_filter_include.get()).strip(),
-            filter_exclude=str(self.var_filter_exclude.get()).strip(),
-        )
+        opts = self._snapshot_options()
         # start worker
         self._worker = threading.Thread(
             target=self._worker_run,
@@ -3283,89 +3996,144 @@ class RenameApp(_BaseTk):
         self._worker.start()
 
         # start draining queue
-        self.after(50, self._drain_queue)
+        self._schedule_drain(50)
 
     def _cancel_processing(self):
         if self.processing:
             self._cancel_event.set()
 
     def _q_put(self, event: dict):
-        self._q.put(event)
+        self._q.append(event)
+        # 只写不读：多个生产者同时置 True 也没有竞争
+        self._q_ready = True
+
+    def _schedule_drain(self, delay_ms: int):
+        """(Re)arm the single timer that drains the queue."""
+        if self._drain_after_id is not None:
+            try:
+                self.after_cancel(self._drain_after_id)
+            except Exception:
+                pass
+        self._drain_after_id = self.after(delay_ms, self._drain_queue)
 
     def _drain_queue(self):
-        drained_any = False
-        try:
-            while True:
-                ev = self._q.get_nowait()
-                drained_any = True
-
-                et = ev.get('type')
-                if et == 'log':
-                    self._append_log(ev.get('msg', ''), ev.get('tag', 'info'))
-                elif et == 'progress':
-                    cur = int(ev.get('current', 0))
-                    tot = int(ev.get('total', 0))
-                    self.progress['maximum'] = max(tot, 1)
-                    self.progress['value'] = cur
-                    t = TEXTS[self.language]
-                    key = 'status_undoing' if getattr(self, '_progress_mode', 'rename') == 'undo' else 'status_processing'
-                    self.status_label.config(text=t[key].format(cur, tot), font=self._font(12))
-                elif et == 'precheck':
-                    token = int(ev.get('token', 0))
-                    if token != self._precheck_token:
-                        continue
-                    conflicts = ev.get('conflicts', []) or []
-                    err = ev.get('error')
-                    if err:
-                        self._last_conflicts = []
-                        self._conflict_count = 0
-                        self._set_conflict_display(f"{TEXTS[self.language]['conflict_unknown']} ({err})", conflicts=[])
-                        self._precheck_inflight = False
-                    else:
-                        self._last_conflicts = conflicts
-                        self._conflict_count = len(conflicts)
-                        self._set_conflict_display(TEXTS[self.language]['conflict_estimate'].format(n=len(conflicts)), conflicts=conflicts)
-                        self._precheck_inflight = False
-
-                elif et == 'preview':
-                    token = int(ev.get('token', 0))
-                    if token != self._preview_token:
-                        continue
-                    err = ev.get('error')
-                    rows = ev.get('rows', []) or []
-                    self._preview_rows = rows
+        self._drain_after_id = None
+        # 先清标志再取队列：之后入队的事件会让下一轮走短间隔
+        had_new = self._q_ready
+        self._q_ready = False
+        yield_now = False
+        # 一轮里的 log 先攒起来一次性插入；progress 只保留最后一条，避免按 worker 速度重绘
+        logs: list[tuple[str, str]] = []
+        progress_last: dict | None = None
+        # 只有 GUI 线程在取：先判空再 popleft 不会和别人抢
+        q = self._q
+        popleft = q.popleft
+        while q:
+            ev = popleft()
+
+            et = ev.get('type')
+            if et == 'log':
+                logs.append((ev.get('msg', ''), ev.get('tag', 'info')))
+                continue
+            if et == 'log_batch':
+                logs.extend(ev.get('items') or ())
+                continue
+            if et == 'progress':
+                progress_last = ev
+                continue
+            if et in ('done', 'undo_done'):
+                # 结果弹窗之前先把本轮积压的日志/进度刷出去
+                self._append_logs(logs)
+                logs = []
+                if progress_last is not None:
+                    self._apply_progress(progress_last)
+                    progress_last = None
+
+            if et == 'precheck':
+                token = int(ev.get('token', 0))
+                if token != self._precheck_token:
+                    continue
+                conflicts = ev.get('conflicts', []) or []
+                err = ev.get('error')
+                if err:
+                    self._last_conflicts = []
+                    self._conflict_count = 0
+                    self._set_conflict_display(f"{self._t.conflict_unknown} ({err})", conflicts=[])
+                    self._precheck_inflight = False
+                else:
+                    self._last_conflicts = conflicts
+                    self._conflict_count = len(conflicts)
+                    self._set_conflict_display(self._t.conflict_estimate.format(n=len(conflicts)), conflicts=conflicts)
+                    self._precheck_inflight = False
+
+            elif et == 'preview_chunk':
+                token = int(ev.get('token', 0))
+                if token != self._preview_token:
+                    continue
+                self._preview_append_chunk(ev.get('rows', []) or [], bool(ev.get('first')))
+                # 每插入一批就把控制权还给 Tk 事件循环，剩下的批次下一轮再取
+                yield_now = True
+                break
+
+            elif et == 'refresh_cancelled':
+                # 被取消的刷新不会再发 precheck/preview_done；token 仍是当前的才清标志，
+                # 已被新刷新接管时标志归新的一轮管
+                if int(ev.get('pre_token', 0)) == self._precheck_token:
+                    self._precheck_inflight = False
+                if int(ev.get('prev_token', 0)) == self._preview_token:
                     self._preview_inflight = False
-                    if err:
-                        try:
-                            messagebox.showerror('Error', err)
-                        except Exception:
-                            pass
-                    self._preview_set_data(rows)
-                    
 
-                elif et == 'done':
-                    result: RenameResult = ev['result']
-                    self._on_processing_done(result)
+            elif et == 'preview_done':
+                token = int(ev.get('token', 0))
+                if token != self._preview_token:
+                    continue
+                self._preview_inflight = False
+                err = ev.get('error')
+                if err:
+                    try:
+                        messagebox.showerror('Error', err)
+                    except Exception:
+                        pass
+                if self._preview_selected_idx is None:
+                    self._preview_show_detail_placeholder()
 
-                elif et == 'undo_done':
-                    result: UndoResult = ev['result']
-                    self._on_undo_done(result)
-                else:
-                    pass
-        except queue.Empty:
-            pass
+            elif et == 'done':
+                result: RenameResult = ev['result']
+                self._on_processing_done(result)
 
-        # continue polling if still processing or queue not empty
-        if self.processing or self._precheck_inflight or self._preview_inflight:
-            self.after(60 if drained_any else 120, self._drain_queue)
+            elif et == 'undo_done':
+                result: UndoResult = ev['result']
+                self._on_undo_done(result)
+            else:
+                pass
+
+        self._append_logs(logs)
+        if progress_last is not None:
+            self._apply_progress(progress_last)
+
+        # 只在让出后续批次、或任务在途时继续定时；空闲时不留任何定时器。
+        # 上一轮有新事件就 50ms 后再来，否则退到 250ms
+        if yield_now:
+            self._schedule_drain(1)
+        elif self.processing or self._precheck_inflight or self._preview_inflight:
+            self._schedule_drain(50 if had_new else 250)
+
+    def _apply_progress(self, ev: dict):
+        cur = int(ev.get('current', 0))
+        tot = int(ev.get('total', 0))
+        self.progress['maximum'] = max(tot, 1)
+        self.progress['value'] = cur
+        t = self._t
+        fmt = t.status_undoing if getattr(self, '_progress_mode', 'rename') == 'undo' else t.status_processing
+        self.status_label.config(text=fmt.format(cur, tot))
 
     def _on_processing_done(self, result: RenameResult):
-        t = TEXTS[self.language]
+        t = self._t
 
         if result.cancelled:
-            self.status_label.config(text=t['status_cancelled'], font=self._font(12))
+            self.status_label.config(text=t.status_cancelled)
         else:
-            self.status_label.config(text=t['processing_complete'], font=self._font(12))
+            self.status_label.config(text=t.processing_complete)
 
         self._set_processing_ui(False)
         self._refresh_undo_state()
@@ -3377,6 +4145,24 @@ class RenameApp(_BaseTk):
         start = time.time()
         result = RenameResult()
         ops: list[dict] = []  # for undo history (only real renames)
+        # 撤销记录里不随执行变化的部分在开头就建好；finally 里只补 ops / cancelled
+        history_base = {
+            'id': uuid4().hex,
+            'ts': datetime.now().isoformat(timespec='seconds'),
+            'target_path': target_path,
+            'is_single_file': bool(is_single_file),
+            'options': {
+                'include_subfolders': bool(opts.include_subfolders),
+                'dry_run': bool(opts.dry_run),
+                'parallel_rename': bool(opts.parallel_rename),
+                'skip_hardlinks': bool(opts.skip_hardlinks),
+                'date_source': str(opts.date_source),
+                'filter_exts': str(opts.filter_exts),
+                'filter_include': str(opts.filter_include),
+                'filter_exclude': str(opts.filter_exclude),
+            },
+            'status': 'done',
+        }
 
         try:
             # 1) Build a unified plan (also applies filters + simulates conflicts)
@@ -3424,50 +4210,166 @@ class RenameApp(_BaseTk):
             self._q_put({'type': 'progress', 'current': 0, 'total': result.total})
 
             # 2) Execute the plan
-            for i, it in enumerate(plan.items, start=1):
-                if self._cancel_event.is_set():
-                    result.cancelled = True
-                    self._q_put({'type': 'log', 'tag': 'warning', 'msg': t['processing_cancelled']})
-                    break
-
-                src = it.path
-                original_name = it.original_name
+            # 循环内只用局部变量：方法、格式化函数都先取出来，计数结束后再写回 result
+            # POSIX 下直接绑定 os.rename（_safe_rename 只为 Windows 长路径多包一层）。
+            # 不用 os.replace：Windows 上 os.rename 遇到目标已存在会报错，计划之后才出现的同名文件不会被覆盖
+            _rename = _safe_rename if _is_windows() else os.rename
+            q_put = self._q_put
+            cancel_is_set = self._cancel_event.is_set
+            # 模板直接绑定成 str.format 方法：循环里既不查 TEXTS 也不查 .format 属性
+            fmt_skip = t['skip'].format
+            fmt_skip_hardlink = t['skip_hardlink'].format
+            fmt_error = t['error'].format
+            fmt_conflict = t['conflict_resolved'].format
+            fmt_preview = t['preview_rename'].format
+            fmt_success = t['success_rename'].format
+            fmt_dir_summary = (t['dir_summary_preview'] if opts.dry_run else t['dir_summary']).format
+            fallback_note = f" ({t['summary_exif_fallback']})"
+            total = result.total
+            dry_run = opts.dry_run
+            verbose = opts.verbose_log
+            _dirname = os.path.dirname
+            _monotonic = time.monotonic
+            # 全局完成序号：并行分组共用，next() 在 GIL 下是原子的
+            done_counter = itertools.count(1)
+            # 撤销记录直接进共享的 ops（list.append 在 GIL 下是原子的）：哪怕某组中途抛异常，
+            # 已经落盘的重命名也会写进历史
+            ops_append = ops.append
+            # 计数合并、进度上报共用一把锁；进度只报已发出的最大序号，进度条不会倒退
+            merge_lock = threading.Lock()
+            progress_hw = [0]
+
+            def _report_progress(i: int):
+                with merge_lock:
+                    if i > progress_hw[0]:
+                        progress_hw[0] = i
+                    q_put({'type': 'progress', 'current': progress_hw[0], 'total': total})
+
+            def _run_items(items: list[PlanItem]) -> None:
+                """Execute plan items in order; ops go to the shared list, counters are merged into result."""
+                renamed = skipped = errors = conflicts = 0
+                cancelled = False
+                # 日志先攒在本地，进度每 32 个文件或每 50ms 才发一次，
+                # 两者一起出队：大批量时队列消息数降到原来的几十分之一
+                log_batch: list[tuple[str, str]] = []
+                log_append = log_batch.append
+                last_flush = _monotonic()
+                # 非详细模式：跳过/成功/冲突只按目录计数 [renamed, skipped, conflicts]，
+                # 结束时每个目录一行汇总；错误始终逐条记录
+                dir_counts: dict[str, list[int]] = {}
+
+                def _counts_of(src: Path) -> list[int]:
+                    d = _dirname(str(src))
+                    c = dir_counts.get(d)
+                    if c is None:
+                        c = dir_counts[d] = [0, 0, 0]
+                    return c
 
+                i = 0
                 try:
-                    if it.status == 'skip_prefix':
-                        result.skipped += 1
-                        self._q_put({'type': 'log', 'tag': 'skip', 'msg': t['skip'].format(original_name)})
-                        self._q_put({'type': 'progress', 'current': i, 'total': result.total})
-                        continue
+                    for it in items:
+                        if cancel_is_set():
+                            cancelled = True
+                            break
+                        i = next(done_counter)
 
-                    if it.status == 'error':
-                        result.errors += 1
-                        self._q_put({'type': 'log', 'tag': 'error', 'msg': t['error'].format(str(src), it.error or 'unknown error')})
-                        self._q_put({'type': 'progress', 'current': i, 'total': result.total})
-                        continue
+                        src = it.path
+                        original_name = it.original_name
+                        status = it.status
 
-                    # rename item
-                    final_name = it.final_name or original_name
-                    base_name = it.base_name or final_name
-
-                    if (it.conflict_index or 0) > 0:
-                        result.conflicts += 1
-                        self._q_put({'type': 'log', 'tag': 'warning', 'msg': t['conflict_resolved'].format(base_name, final_name)})
-
-                    if opts.dry_run:
-                        result.renamed += 1
-                        self._q_put({'type': 'log', 'tag': 'preview', 'msg': t['preview_rename'].format(original_name, final_name) + (f" ({t['summary_exif_fallback']})" if it.note_code else '')})
-                    else:
-                        dst = src.with_name(final_name)
-                        _safe_rename(src, dst)
-                        ops.append({'old': str(src), 'new': str(dst)})
-                        result.renamed += 1
-                        self._q_put({'type': 'log', 'tag': 'success', 'msg': t['success_rename'].format(original_name, final_name) + (f" ({t['summary_exif_fallback']})" if it.note_code else '')})
-                except Exception as e:
-                    result.errors += 1
-                    self._q_put({'type': 'log', 'tag': 'error', 'msg': t['error'].format(str(src), str(e))})
-
-                self._q_put({'type': 'progress', 'current': i, 'total': result.total})
+                        try:
+                            if status == 'skip_prefix' or status == 'skip_hardlink':
+                                skipped += 1
+                                if not verbose:
+                                    _counts_of(src)[1] += 1
+                                elif status == 'skip_prefix':
+                                    log_append((fmt_skip(original_name), 'skip'))
+                                else:
+                                    log_append((fmt_skip_hardlink(original_name), 'skip'))
+                            elif status == 'error':
+                                errors += 1
+                                log_append((fmt_error(str(src), it.error or 'unknown error'), 'error'))
+                            else:
+                                # rename item
+                                final_name = it.final_name or original_name
+                                base_name = it.base_name or final_name
+                                counts = None if verbose else _counts_of(src)
+
+                                if it.conflict_index:
+                                    conflicts += 1
+                                    if counts is None:
+                                        log_append((fmt_conflict(base_name, final_name), 'warning'))
+                                    else:
+                                        counts[2] += 1
+
+                                note = fallback_note if it.note_code else ''
+                                if dry_run:
+                                    renamed += 1
+                                    if counts is None:
+                                        log_append((fmt_preview(original_name, final_name) + note, 'preview'))
+                                    else:
+                                        counts[0] += 1
+                                else:
+                                    # 目标路径直接拼字符串（同 with_name：替换最后一段名字），
+                                    # 不再构造 PurePath；撤销记录本来就存字符串
+                                    src_str = str(src)
+                                    dst_str = src_str[:len(src_str) - len(original_name)] + final_name
+                                    _rename(src_str, dst_str)
+                                    ops_append({'old': src_str, 'new': dst_str})
+                                    renamed += 1
+                                    if counts is None:
+                                        log_append((fmt_success(original_name, final_name) + note, 'success'))
+                                    else:
+                                        counts[0] += 1
+                        except Exception as e:
+                            errors += 1
+                            log_append((fmt_error(str(src), str(e)), 'error'))
+
+                        now = _monotonic()
+                        if (i & 31) == 0 or now - last_flush >= 0.05:
+                            if log_batch:
+                                q_put({'type': 'log_batch', 'items': log_batch[:]})
+                                log_batch.clear()
+                            _report_progress(i)
+                            last_flush = now
+                finally:
+                    for d, (n_renamed, n_skipped, n_conflicts) in dir_counts.items():
+                        log_append((fmt_dir_summary(dir=d, renamed=n_renamed, skipped=n_skipped, conflicts=n_conflicts), 'info'))
+                    if log_batch:
+                        q_put({'type': 'log_batch', 'items': log_batch[:]})
+                    if i:
+                        _report_progress(i)
+                    with merge_lock:
+                        result.renamed += renamed
+                        result.skipped += skipped
+                        result.errors += errors
+                        result.conflicts += conflicts
+                        if cancelled:
+                            result.cancelled = True
+
+            # 真正重命名且涉及多个父目录时按目录分组并行；组内仍按计划顺序串行
+            # （同目录的目标名在计划阶段已互相避让，不同目录之间没有依赖）
+            groups: list[list[PlanItem]] | None = None
+            workers = os.cpu_count() or 1
+            if not dry_run and opts.parallel_rename and workers > 1:
+                by_dir: dict[str, list[PlanItem]] = {}
+                for it in plan.items:
+                    by_dir.setdefault(os.path.dirname(str(it.path)), []).append(it)
+                if len(by_dir) > 1:
+                    groups = list(by_dir.values())
+
+            if groups is None:
+                _run_items(plan.items)
+            else:
+                with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=min(_RENAME_PARALLEL_WORKERS, workers, len(groups)),
+                    thread_name_prefix='ar-rename',
+                ) as ex:
+                    # 每组在自己的 finally 里合并计数；这里只需把异常（若有）抛给外层 finally
+                    for _ in ex.map(_run_items, groups):
+                        pass
+            if result.cancelled:
+                q_put({'type': 'log', 'tag': 'warning', 'msg': t['processing_cancelled']})
 
         finally:
             result.elapsed = time.time() - start
@@ -3475,24 +4377,7 @@ class RenameApp(_BaseTk):
             # persist undo history (only when real renames occurred)
             if (not opts.dry_run) and ops:
                 try:
-                    entry = {
-                        'id': uuid4().hex,
-                        'ts': datetime.now().isoformat(timespec='seconds'),
-                        'target_path': target_path,
-                        'is_single_file': bool(is_single_file),
-                        'options': {
-                            'include_subfolders': bool(opts.include_subfolders),
-                            'dry_run': bool(opts.dry_run),
-                            'date_source': str(opts.date_source),
-                            'filter_exts': str(opts.filter_exts),
-                            'filter_include': str(opts.filter_include),
-                            'filter_exclude': str(opts.filter_exclude),
-                        },
-                        'ops': ops,
-                        'status': 'done',
-                        'cancelled': bool(result.cancelled),
-                    }
-                    _append_history_entry(entry)
+                    _append_history_entry(dict(history_base, ops=ops, cancelled=bool(result.cancelled)))
                 except Exception:
                     pass
 
@@ -3500,10 +4385,10 @@ class RenameApp(_BaseTk):
 
     # ---------- dialogs ----------
     def _show_result_dialog(self, result: RenameResult):
-        t = TEXTS[self.language]
+        t = self._t
 
         dialog = tk.Toplevel(self)
-        dialog.title(t['dialog_title_cancel'] if result.cancelled else t['dialog_title'])
+        dialog.title(t.dialog_title_cancel if result.cancelled else t.dialog_title)
         dialog.configure(bg=COLORS['bg_main'])
         dialog.transient(self)
         dialog.grab_set()
@@ -3514,12 +4399,12 @@ class RenameApp(_BaseTk):
 
         icon = '✓' if (not result.cancelled and result.errors == 0) else '⚠'
         icon_color = COLORS['success'] if (not result.cancelled and result.errors == 0) else COLORS['warning']
-        tk.Label(outer, text=icon, font=self._font(56, 'bold'), bg=COLORS['bg_main'], fg=icon_color).pack(pady=(0, 6))
+        tk.Label(outer, text=icon, font=Fonts.BODY56B, bg=COLORS['bg_main'], fg=icon_color).pack(pady=(0, 6))
 
         tk.Label(
             outer,
-            text=t['dialog_title_cancel'] if result.cancelled else t['dialog_title'],
-            font=self._font(22, 'bold'),
+            text=t.dialog_title_cancel if result.cancelled else t.dialog_title,
+            font=Fonts.BODY22B,
             bg=COLORS['bg_main'],
             fg=COLORS['text_primary'],
         ).pack(pady=(0, 14))
@@ -3531,27 +4416,26 @@ class RenameApp(_BaseTk):
         inner.pack(fill=tk.BOTH, expand=True)
 
         rows = [
-            (t['success_rename_label'], result.renamed, COLORS['success']),
-            (t['skip_label'], result.skipped, COLORS['text_secondary']),
-            (t['filtered_label'], result.filtered, COLORS['text_secondary']),
-            (t['conflict_label'], result.conflicts, COLORS['warning'] if result.conflicts > 0 else COLORS['text_secondary']),
-            (t['error_label'], result.errors, COLORS['warning'] if result.errors > 0 else COLORS['text_secondary']),
+            (t.success_rename_label, result.renamed, COLORS['success']),
+            (t.skip_label, result.skipped, COLORS['text_secondary']),
+            (t.filtered_label, result.filtered, COLORS['text_secondary']),
+            (t.conflict_label, result.conflicts, COLORS['warning'] if result.conflicts > 0 else COLORS['text_secondary']),
+            (t.error_label, result.errors, COLORS['warning'] if result.errors > 0 else COLORS['text_secondary']),
         ]
 
-        for label, value, color in rows:
-            line = tk.Frame(inner, bg=COLORS['bg_card'])
-            line.pack(fill=tk.X, pady=6)
-            tk.Label(line, text=label, font=self._font(13), bg=COLORS['bg_card'], fg=COLORS['text_secondary']).pack(side=tk.LEFT)
-            tk.Label(line, text=str(value), font=self._font(13, 'bold'), bg=COLORS['bg_card'], fg=color).pack(side=tk.RIGHT)
+        # 两列 grid 直接排在 inner 里：不再每行套一个 Frame
+        inner.grid_columnconfigure(0, weight=1)
+        for r, (label, value, color) in enumerate(rows):
+            tk.Label(inner, text=label, font=Fonts.BODY13, bg=COLORS['bg_card'], fg=COLORS['text_secondary']).grid(row=r, column=0, sticky='w', pady=6)
+            tk.Label(inner, text=str(value), font=Fonts.BODY13B, bg=COLORS['bg_card'], fg=color).grid(row=r, column=1, sticky='e', pady=6)
 
-        line = tk.Frame(inner, bg=COLORS['bg_card'])
-        line.pack(fill=tk.X, pady=(12, 0))
-        tk.Label(line, text=t['time_label'], font=self._font(13), bg=COLORS['bg_card'], fg=COLORS['text_secondary']).pack(side=tk.LEFT)
-        tk.Label(line, text=f"{result.elapsed:.2f}{t['time_unit']}", font=self._font(13, 'bold'), bg=COLORS['bg_card'], fg=COLORS['text_primary']).pack(side=tk.RIGHT)
+        r = len(rows)
+        tk.Label(inner, text=t.time_label, font=Fonts.BODY13, bg=COLORS['bg_card'], fg=COLORS['text_secondary']).grid(row=r, column=0, sticky='w', pady=(12, 0))
+        tk.Label(inner, text=f"{result.elapsed:.2f}{t.time_unit}", font=Fonts.BODY13B, bg=COLORS['bg_card'], fg=COLORS['text_primary']).grid(row=r, column=1, sticky='e', pady=(12, 0))
 
         btn = PillButton(
             outer,
-            text=t['close'],
+            text=t.close,
             height=44,
             radius=22,
             fill=COLORS['bg_button'],
@@ -3559,7 +4443,7 @@ class RenameApp(_BaseTk):
             outline=COLORS['bg_button'],
             outline_width=0,
             fg=COLORS['text_button'],
-            font=self._font(11, 'bold'),
+            font=Fonts.BODY11B,
             command=dialog.destroy,
         )
         btn.pack(pady=(16, 0))
@@ -0,0 +1,65 @@
+import importlib.util
+import os
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+_SRC = Path(__file__).resolve().parent.parent / 'AutoRenamer_v2.0.py'
+
+
+def _load():
+    spec = importlib.util.spec_from_file_location('autorenamer_v2', _SRC)
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+
+ar = _load()
+
+
+def _clear_caches():
+    for name in ('_ymd_from_second', '_ymd_from_bucket'):
+        fn = getattr(ar, name, None)
+        if fn is not None:
+            fn.cache_clear()
+
+
+@pytest.fixture
+def tz():
+    old = os.environ.get('TZ')
+
+    def _set(name):
+        os.environ['TZ'] = name
+        time.tzset()
+        _clear_caches()
+
+    yield _set
+    if old is None:
+        os.environ.pop('TZ', None)
+    else:
+        os.environ['TZ'] = old
+    time.tzset()
+    _clear_caches()
+
+
+@pytest.mark.parametrize('zone, ts, expected', [
+    # St_Johns 在本地 00:01 退出夏令时，跨过的 15 分钟窗口前后日期不同
+    ('America/St_Johns', 1257042873, '20091031'),
+    ('America/St_Johns', 1257042900, '20091031'),
+    ('America/Moncton', 1162090900, '20061028'),
+])
+def test_ymd_near_off_grid_dst_transition(tz, zone, ts, expected):
+    tz(zone)
+    assert ar._ymd_from_timestamp(ts) == expected
+    assert datetime.fromtimestamp(ts).strftime('%Y%m%d') == expected
+
+
+def test_ymd_matches_datetime_around_transition(tz):
+    tz('America/St_Johns')
+    # 按同一窗口先后查询，缓存不能把前一个时间戳的日期带给后一个
+    for ts in range(1257042000, 1257048000, 7):
+        assert ar._ymd_from_timestamp(ts) == datetime.fromtimestamp(ts).strftime('%Y%m%d'), ts